@@ -1,7 +1,7 @@
 from .base import Algorithm, AlgorithmResult
 from .traversal import BFS, DFS
 from .shortest_path import Dijkstra, AStar
-from .components import ConnectedComponents
+from .components import ConnectedComponents, ParallelConnectedComponents
 from .centrality import DegreeCentrality
 from .coloring import WelshPowell
 
@@ -9,7 +9,7 @@ __all__ = [
     'Algorithm', 'AlgorithmResult',
     'BFS', 'DFS',
     'Dijkstra', 'AStar',
-    'ConnectedComponents',
+    'ConnectedComponents', 'ParallelConnectedComponents',
     'DegreeCentrality',
     'WelshPowell'
 ]
@@ -0,0 +1,53 @@
+"""
+Array-based traversal kernels over a CSR (compressed sparse row) graph,
+as returned by Graph.csr_view().
+
+The kernels work on node positions rather than node IDs so they can be
+JIT-compiled with numba when it is installed. Without numba the same
+functions run as plain Python, just more slowly.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # Optional speedup; the kernels run as plain Python instead
+    njit = None
+
+
+def bfs_csr(indptr: np.ndarray, indices: np.ndarray, src: np.int32) -> np.ndarray:
+    """
+    Breadth-first visit order from position src.
+    
+    Args:
+        indptr: CSR row offsets
+        indices: CSR neighbor positions
+        src: Starting position
+        
+    Returns:
+        Visited positions in BFS order
+    """
+    n = indptr.shape[0] - 1
+    visited = np.zeros(n, dtype=np.bool_)
+    # Every node is enqueued at most once, so the order array is the queue
+    order = np.empty(n, dtype=np.int32)
+    head = 0
+    tail = 1
+    order[0] = src
+    visited[src] = True
+    
+    while head < tail:
+        node = order[head]
+        head += 1
+        for k in range(indptr[node], indptr[node + 1]):
+            neighbor = indices[k]
+            if not visited[neighbor]:
+                visited[neighbor] = True
+                order[tail] = neighbor
+                tail += 1
+    
+    return order[:tail]
+
+
+if njit is not None:
+    # Explicit signature: compiled once up front, no type inference per call
+    bfs_csr = njit('int32[:](int32[:], int32[:], int32)', cache=True)(bfs_csr)
@@ -77,6 +77,7 @@ class WelshPowell(Algorithm):
         
         # Step 2: Color nodes greedily
         coloring: Dict[int, int] = {}  # node_id -> color_index
+        adjacency = self.graph.adjacency_view()
         colored_nodes: Set[int] = set()
         
         current_color = 0
@@ -88,7 +89,7 @@ class WelshPowell(Algorithm):
                     continue
                 
                 # Check if this node can be colored with current color
-                neighbors = self.graph.get_neighbor_ids(node_id)
+                neighbors = adjacency[node_id]
                 neighbor_colors = {coloring.get(n) for n in neighbors if n in coloring}
                 
                 if current_color not in neighbor_colors:
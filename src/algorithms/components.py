@@ -1,10 +1,58 @@
 """
 Connected Components detection algorithm.
 """
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
 from typing import Dict, List, Set
+
+import numpy as np
+
 from .base import Algorithm, AlgorithmResult
 
 
+def _find(parent: List[int], x: int) -> int:
+    """Return the root of x, halving the path on the way."""
+    while parent[x] != x:
+        parent[x] = parent[parent[x]]
+        x = parent[x]
+    return x
+
+
+def _union_edges(parent: List[int], pairs) -> None:
+    """Merge the sets of both endpoints of every (u, v) pair."""
+    for u, v in pairs:
+        root_u = _find(parent, u)
+        root_v = _find(parent, v)
+        if root_u != root_v:
+            parent[root_v] = root_u
+
+
+def _union_find_shard(shm_name: str, edge_count: int, node_count: int,
+                      shard: int, start: int, stop: int) -> None:
+    """
+    Union-find over one slice of a shared (E, 2) edge array.
+    
+    Runs in a worker process and attaches to the shared block by name, so
+    neither the edges nor the result are pickled. The root of every node
+    position within this shard's forest is written to row `shard` of the
+    (shards, V) roots array that follows the edges in the block.
+    """
+    shm = SharedMemory(name=shm_name)
+    try:
+        edges = np.ndarray((edge_count, 2), dtype=np.int32, buffer=shm.buf)
+        parent = list(range(node_count))
+        _union_edges(parent, edges[start:stop].tolist())
+        
+        roots = np.ndarray((node_count,), dtype=np.int32, buffer=shm.buf,
+                           offset=edges.nbytes + shard * node_count * 4)
+        roots[:] = [_find(parent, x) for x in range(node_count)]
+        del edges, roots
+    finally:
+        shm.close()
+
+
 class ConnectedComponents(Algorithm):
     """
     Algorithm to find connected components in an undirected graph.
@@ -13,6 +61,20 @@ class ConnectedComponents(Algorithm):
     there is a path between every pair of vertices.
     """
     
+    # Colors for components
+    COMPONENT_COLORS = [
+        (0, 217, 255),    # Neon blue
+        (0, 255, 136),    # Neon green
+        (180, 41, 249),   # Neon purple
+        (255, 107, 107),  # Coral red
+        (255, 215, 0),    # Gold
+        (0, 255, 255),    # Cyan
+        (255, 105, 180),  # Hot pink
+        (50, 205, 50),    # Lime green
+        (255, 165, 0),    # Orange
+        (138, 43, 226),   # Blue violet
+    ]
+    
     @property
     def name(self) -> str:
         return "Bağlı Bileşenler"
@@ -42,28 +104,18 @@ class ConnectedComponents(Algorithm):
         components: List[List[int]] = []
         component_map: Dict[int, int] = {}  # node_id -> component_index
         
-        # Colors for components
-        component_colors = [
-            (0, 217, 255),    # Neon blue
-            (0, 255, 136),    # Neon green
-            (180, 41, 249),   # Neon purple
-            (255, 107, 107),  # Coral red
-            (255, 215, 0),    # Gold
-            (0, 255, 255),    # Cyan
-            (255, 105, 180),  # Hot pink
-            (50, 205, 50),    # Lime green
-            (255, 165, 0),    # Orange
-            (138, 43, 226),   # Blue violet
-        ]
+        component_colors = self.COMPONENT_COLORS
+        
+        adjacency = self.graph.adjacency_view()
         
         def bfs_component(start_id: int) -> List[int]:
             """Find all nodes in the component containing start_id."""
             component = []
-            queue = [start_id]
+            queue = deque([start_id])
             visited.add(start_id)
             
             while queue:
-                node_id = queue.pop(0)
+                node_id = queue.popleft()
                 component.append(node_id)
                 
                 self._add_step(
@@ -72,7 +124,7 @@ class ConnectedComponents(Algorithm):
                     component_index=len(components)
                 )
                 
-                for neighbor_id in self.graph.get_neighbor_ids(node_id):
+                for neighbor_id in adjacency[node_id]:
                     if neighbor_id not in visited:
                         visited.add(neighbor_id)
                         queue.append(neighbor_id)
@@ -128,5 +180,126 @@ class ConnectedComponents(Algorithm):
         )
 
 
-
-
+class ParallelConnectedComponents(ConnectedComponents):
+    """
+    Connected components via union-find over edge shards in worker processes.
+    
+    Edges are placed once in shared memory and split into one shard per
+    worker; each worker builds a local union-find forest and writes its
+    roots back to shared memory, where this process merges them. Small graphs are handled in
+    process, where starting workers would cost more than the work itself.
+    Component members are listed in graph order rather than BFS order.
+    """
+    
+    # Below this many edges the union-find runs without worker processes
+    MIN_PARALLEL_EDGES = 20000
+    
+    @property
+    def name(self) -> str:
+        return "Bağlı Bileşenler (Paralel)"
+    
+    def execute(self, workers: int = 0, **kwargs) -> AlgorithmResult:
+        """
+        Find all connected components using parallel union-find.
+        
+        Args:
+            workers: Number of worker processes (0 = os.cpu_count())
+            
+        Returns:
+            AlgorithmResult with list of components
+        """
+        self._clear_steps()
+        self._start_timer()
+        
+        if not self.graph.nodes:
+            return self._create_result(
+                success=True,
+                data={'components': [], 'component_count': 0},
+                message="Graf boş"
+            )
+        
+        ids = list(self.graph.nodes)
+        position = {node_id: i for i, node_id in enumerate(ids)}
+        edges = np.array(
+            [(position[e.source.id], position[e.target.id]) for e in self.graph.edges],
+            dtype=np.int32
+        ).reshape(-1, 2)
+        
+        parent = list(range(len(ids)))
+        workers = workers or os.cpu_count() or 1
+        if workers < 2 or len(edges) < self.MIN_PARALLEL_EDGES:
+            _union_edges(parent, edges.tolist())
+        else:
+            self._union_shards(parent, edges, workers)
+        
+        # Group node IDs by root, largest components first
+        groups: Dict[int, List[int]] = {}
+        for i, node_id in enumerate(ids):
+            groups.setdefault(_find(parent, i), []).append(node_id)
+        components = sorted(groups.values(), key=len, reverse=True)
+        
+        component_map: Dict[int, int] = {}
+        component_details = []
+        for i, comp in enumerate(components):
+            color = self.COMPONENT_COLORS[i % len(self.COMPONENT_COLORS)]
+            for nid in comp:
+                component_map[nid] = i
+            component_details.append({
+                'index': i,
+                'nodes': comp,
+                'size': len(comp),
+                'color': color
+            })
+            self._add_step(
+                'component_complete',
+                component_index=i,
+                component_nodes=comp,
+                color=color
+            )
+        
+        result_data = {
+            'components': components,
+            'component_details': component_details,
+            'component_count': len(components),
+            'component_map': component_map,
+            'largest_component_size': len(components[0]),
+            'isolated_nodes': [c[0] for c in components if len(c) == 1]
+        }
+        
+        return self._create_result(
+            success=True,
+            data=result_data,
+            message=f"{len(components)} bağlı bileşen bulundu"
+        )
+    
+    @staticmethod
+    def _union_shards(parent: List[int], edges: np.ndarray, workers: int) -> None:
+        """Run union-find on one edge shard per worker and merge the forests."""
+        node_count = len(parent)
+        bounds = np.linspace(0, len(edges), workers + 1, dtype=int).tolist()
+        shards = [(start, stop) for start, stop in zip(bounds, bounds[1:]) if stop > start]
+        
+        # One block holds the edges followed by a row of roots per shard
+        shm = SharedMemory(create=True, size=edges.nbytes + len(shards) * node_count * 4)
+        try:
+            np.ndarray(edges.shape, dtype=np.int32, buffer=shm.buf)[:] = edges
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [
+                    pool.submit(_union_find_shard, shm.name, len(edges),
+                                node_count, shard, start, stop)
+                    for shard, (start, stop) in enumerate(shards)
+                ]
+                for future in futures:
+                    future.result()
+            
+            roots = np.ndarray((len(shards), node_count), dtype=np.int32,
+                               buffer=shm.buf, offset=edges.nbytes)
+            positions = np.arange(node_count, dtype=np.int32)
+            for row in roots:
+                # Only nodes joined to another root within the shard matter
+                moved = np.flatnonzero(row != positions)
+                _union_edges(parent, zip(moved.tolist(), row[moved].tolist()))
+            del roots
+        finally:
+            shm.close()
+            shm.unlink()
@@ -3,15 +3,23 @@ Shortest path algorithms: Dijkstra and A*.
 """
 import heapq
 import math
-from typing import Dict, List, Optional, Tuple, Set
+from typing import Dict, List, Optional, Tuple, Set, TYPE_CHECKING
 from .base import Algorithm, AlgorithmResult
 
+if TYPE_CHECKING:
+    from ..models.graph import Graph
+
 
 class Dijkstra(Algorithm):
     """
     Dijkstra's shortest path algorithm.
     
     Finds the shortest path between two nodes using edge weights (costs).
+    
+    The frontier is a heapq binary heap with lazy deletion. For in-memory
+    graphs of the sizes this application handles, the C-implemented heapq
+    outperforms pure Python B-heaps or cache-oblivious queues, and costs
+    are real-valued, which rules out bucket queues.
     """
     
     @property
@@ -55,14 +63,17 @@ class Dijkstra(Algorithm):
         # Previous node for path reconstruction
         previous: Dict[int, Optional[int]] = {nid: None for nid in self.graph.nodes}
         
-        # Priority queue: (distance, node_id)
+        # Binary heap of (distance, node_id) without decrease-key: improved
+        # distances are pushed again and stale entries skipped when popped
         pq: List[Tuple[float, int]] = [(0, start_node_id)]
+        heappush, heappop = heapq.heappush, heapq.heappop
+        adjacency = self.graph.adjacency_view()
         visited: Set[int] = set()
         
         while pq:
-            current_dist, current_id = heapq.heappop(pq)
+            current_dist, current_id = heappop(pq)
             
-            if current_id in visited:
+            if current_dist > distances[current_id] or current_id in visited:
                 continue
             
             visited.add(current_id)
@@ -79,7 +90,7 @@ class Dijkstra(Algorithm):
                 break
             
             # Explore neighbors
-            for neighbor_id in self.graph.get_neighbor_ids(current_id):
+            for neighbor_id in adjacency[current_id]:
                 if neighbor_id in visited:
                     continue
                 
@@ -94,7 +105,7 @@ class Dijkstra(Algorithm):
                 if new_dist < distances[neighbor_id]:
                     distances[neighbor_id] = new_dist
                     previous[neighbor_id] = current_id
-                    heapq.heappush(pq, (new_dist, neighbor_id))
+                    heappush(pq, (new_dist, neighbor_id))
                     
                     self._add_step(
                         'update',
@@ -147,6 +158,12 @@ class AStar(Algorithm):
     Uses heuristic (Euclidean distance) to guide search towards goal.
     """
     
+    def __init__(self, graph: 'Graph'):
+        super().__init__(graph)
+        # Heuristic memo for one goal; see _heuristic
+        self._h_cache: Dict[int, float] = {}
+        self._h_goal: Optional[int] = None
+    
     @property
     def name(self) -> str:
         return "A* En Kısa Yol"
@@ -159,6 +176,9 @@ class AStar(Algorithm):
         """
         Calculate heuristic (Euclidean distance between node positions).
         
+        Values are memoized per goal and cleared at the start of every
+        execute() call, since node positions may have moved in between.
+        
         Args:
             node_id: Current node ID
             goal_id: Goal node ID
@@ -166,6 +186,14 @@ class AStar(Algorithm):
         Returns:
             Estimated distance to goal
         """
+        if goal_id != self._h_goal:
+            self._h_cache = {}
+            self._h_goal = goal_id
+        
+        cached = self._h_cache.get(node_id)
+        if cached is not None:
+            return cached
+        
         node = self.graph.nodes.get(node_id)
         goal = self.graph.nodes.get(goal_id)
         
@@ -177,7 +205,9 @@ class AStar(Algorithm):
         dy = node.y - goal.y
         
         # Scale down the heuristic to not overpower the actual cost
-        return math.sqrt(dx * dx + dy * dy) * 0.01
+        estimate = math.sqrt(dx * dx + dy * dy) * 0.01
+        self._h_cache[node_id] = estimate
+        return estimate
     
     def execute(self, start_node_id: int, end_node_id: int, **kwargs) -> AlgorithmResult:
         """
@@ -205,6 +235,9 @@ class AStar(Algorithm):
                 message=f"Hedef düğümü {end_node_id} bulunamadı"
             )
         
+        # Positions may have moved since the last run, so start a fresh memo
+        self._h_cache = {}
+        
         # g_score: cost from start to current
         g_score: Dict[int, float] = {nid: float('inf') for nid in self.graph.nodes}
         g_score[start_node_id] = 0
@@ -221,6 +254,7 @@ class AStar(Algorithm):
         open_set: List[Tuple[float, float, int]] = [(f_score[start_node_id], 0, start_node_id)]
         open_set_nodes: Set[int] = {start_node_id}
         closed_set: Set[int] = set()
+        adjacency = self.graph.adjacency_view()
         
         while open_set:
             _, current_g, current_id = heapq.heappop(open_set)
@@ -268,7 +302,7 @@ class AStar(Algorithm):
             closed_set.add(current_id)
             
             # Explore neighbors
-            for neighbor_id in self.graph.get_neighbor_ids(current_id):
+            for neighbor_id in adjacency[current_id]:
                 if neighbor_id in closed_set:
                     continue
                 
@@ -44,6 +44,7 @@ class BFS(Algorithm):
         visit_order: List[int] = []
         levels: Dict[int, int] = {}  # node_id -> level
         queue: deque = deque([(start_node_id, 0)])
+        adjacency = self.graph.adjacency_view()
         
         visited.add(start_node_id)
         
@@ -52,16 +53,18 @@ class BFS(Algorithm):
             visit_order.append(node_id)
             levels[node_id] = level
             
-            # Record step for animation
+            # Record step for animation; the visited set so far is the start
+            # node plus all earlier 'discover' steps, so only its size is
+            # stored (a full copy per step would make BFS quadratic)
             self._add_step(
                 'visit',
                 node_id=node_id,
                 level=level,
-                visited=list(visited)
+                visited_count=len(visited)
             )
             
             # Explore neighbors
-            for neighbor_id in self.graph.get_neighbor_ids(node_id):
+            for neighbor_id in adjacency[node_id]:
                 if neighbor_id not in visited:
                     visited.add(neighbor_id)
                     queue.append((neighbor_id, level + 1))
@@ -126,6 +129,7 @@ class DFS(Algorithm):
         discovery_time: Dict[int, int] = {}
         finish_time: Dict[int, int] = {}
         time_counter = [0]  # Use list for mutable reference
+        adjacency = self.graph.adjacency_view()
         
         def dfs_visit(node_id: int, depth: int = 0):
             visited.add(node_id)
@@ -140,7 +144,7 @@ class DFS(Algorithm):
                 discovery_time=discovery_time[node_id]
             )
             
-            for neighbor_id in self.graph.get_neighbor_ids(node_id):
+            for neighbor_id in adjacency[node_id]:
                 if neighbor_id not in visited:
                     self._add_step(
                         'explore_edge',
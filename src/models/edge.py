@@ -4,6 +4,8 @@ Edge class representing a connection between two nodes in the social network gra
 from dataclasses import dataclass, field
 from typing import Optional, Dict, Any, TYPE_CHECKING
 
+from ..utils.weight_calculator import calculate_weight
+
 if TYPE_CHECKING:
     from .node import Node
 
@@ -42,19 +44,7 @@ class Edge:
         Returns:
             Calculated weight value (higher = more similar nodes)
         """
-        activity_diff = self.source.activity - self.target.activity
-        interaction_diff = self.source.interaction - self.target.interaction
-        connection_diff = self.source.connection_count - self.target.connection_count
-        
-        euclidean_distance = (
-            activity_diff ** 2 + 
-            interaction_diff ** 2 + 
-            connection_diff ** 2
-        ) ** 0.5
-        
-        # Weight formula: similar nodes have higher weight
-        weight = 1.0 / (1.0 + euclidean_distance)
-        return weight
+        return calculate_weight(self.source, self.target)
     
     def recalculate_weight(self) -> None:
         """Recalculate and update the edge weight."""
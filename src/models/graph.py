@@ -1,9 +1,21 @@
 """
 Graph class representing the social network as a whole.
 """
-from typing import Dict, List, Optional, Set, Tuple, Any
+import weakref
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Set, Tuple, Any
+
+import numpy as np
+
 from .node import Node
 from .edge import Edge
+from ..utils.weight_calculator import calculate_weights_batch
+
+
+def _edge_key(source_id: int, target_id: int) -> Tuple[int, int]:
+    """Direction-independent key of an undirected edge."""
+    return (source_id, target_id) if source_id < target_id else (target_id, source_id)
 
 
 class Graph:
@@ -14,6 +26,11 @@ class Graph:
         nodes: Dictionary mapping node IDs to Node objects
         edges: List of Edge objects
         _adjacency_list: Cached adjacency list
+        _edge_index: Edges keyed by (lower ID, higher ID) for O(1) lookup
+        _adj_cache: Read-only adjacency view as (version, {id: neighbor tuple})
+        _csr_cache: Cached CSR arrays as (version, (ids, indptr, indices))
+        _version: Counter incremented on every structural change
+        _node_observers: Weak references to node set observers
     """
     
     def __init__(self):
@@ -21,7 +38,89 @@ class Graph:
         self.nodes: Dict[int, Node] = {}
         self.edges: List[Edge] = []
         self._adjacency_list: Dict[int, List[int]] = {}
+        self._edge_index: Dict[Tuple[int, int], Edge] = {}
         self._next_id: int = 1
+        self._version: int = 0
+        self._stats_cache: Optional[Tuple[int, Dict[str, Any]]] = None
+        self._adj_cache: Optional[Tuple[int, Dict[int, Tuple[int, ...]]]] = None
+        self._csr_cache: Optional[Tuple[int, Tuple[List[int], np.ndarray, np.ndarray]]] = None
+        self._bulk_depth: int = 0
+        self._node_observers: List[weakref.WeakMethod] = []
+    
+    @property
+    def version(self) -> int:
+        """Mutation counter, incremented on every structural change."""
+        return self._version
+    
+    def _touch(self) -> None:
+        """Record a structural change unless a bulk insert is in progress."""
+        if not self._bulk_depth:
+            self._version += 1
+    
+    def add_node_observer(self, callback: Callable[[str, Any], None]) -> None:
+        """
+        Register a bound method to be told about node additions and removals.
+        
+        The callback is called as callback(event, payload), where event is
+        'added' (payload: list of new nodes), 'removed' (payload: node ID)
+        or 'reset' (payload: None, after the graph was cleared or loaded).
+        Only a weak reference is kept, so observers do not outlive their
+        owners through the graph.
+        
+        Args:
+            callback: Bound method to call
+        """
+        self._node_observers.append(weakref.WeakMethod(callback))
+    
+    def remove_node_observer(self, callback: Callable[[str, Any], None]) -> None:
+        """
+        Unregister a callback added with add_node_observer.
+        
+        Args:
+            callback: Bound method to remove
+        """
+        self._node_observers = [
+            ref for ref in self._node_observers
+            if ref() is not None and ref() != callback
+        ]
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle without observers, which cannot be pickled."""
+        state = self.__dict__.copy()
+        state['_node_observers'] = []
+        return state
+    
+    def _notify_nodes(self, event: str, payload: Any = None) -> None:
+        """Call the live node observers and drop collected ones."""
+        if not self._node_observers:
+            return
+        
+        live = []
+        for ref in self._node_observers:
+            callback = ref()
+            if callback is not None:
+                live.append(ref)
+                callback(event, payload)
+        self._node_observers = live
+    
+    @contextmanager
+    def bulk_insert(self) -> Iterator['Graph']:
+        """
+        Group many mutations into a single version change.
+        
+        Inside the block, per-item version bumps are suppressed; the version
+        is advanced once on exit so cached views are rebuilt only once.
+        Cached queries made inside the block may therefore be stale.
+        
+        Yields:
+            This graph
+        """
+        self._bulk_depth += 1
+        try:
+            yield self
+        finally:
+            self._bulk_depth -= 1
+            self._touch()
     
     def add_node(self, node: Optional[Node] = None, **kwargs) -> Node:
         """
@@ -47,13 +146,63 @@ class Graph:
         if node.id in self.nodes:
             raise ValueError(f"Node with ID {node.id} already exists")
         
+        self._insert_node(node)
+        self._notify_nodes('added', [node])
+        return node
+    
+    def _insert_node(self, node: Node) -> None:
+        """Store a node whose ID is known to be free."""
         self.nodes[node.id] = node
         self._adjacency_list[node.id] = []
+        self._touch()
         
         if node.id >= self._next_id:
             self._next_id = node.id + 1
+    
+    def add_nodes_bulk(self, ids: Sequence[int], names: Sequence[str],
+                       activities: Sequence[float],
+                       interactions: Sequence[float]) -> List[Node]:
+        """
+        Add many nodes from parallel property columns in one call.
         
-        return node
+        Columns may be lists or numpy arrays; values are stored on the
+        nodes as plain Python numbers. The version is advanced only once.
+        
+        Args:
+            ids: Node IDs
+            names: Display names
+            activities: Activity level per node
+            interactions: Interaction count per node
+            
+        Returns:
+            The added nodes, in column order
+            
+        Raises:
+            ValueError: If the columns differ in length or an ID already
+                exists or repeats; no node is added in that case
+        """
+        ids = [int(node_id) for node_id in ids]
+        activities = [float(value) for value in activities]
+        interactions = [float(value) for value in interactions]
+        if not len(ids) == len(names) == len(activities) == len(interactions):
+            raise ValueError("Node columns must have the same length")
+        
+        seen = set(self.nodes)
+        for node_id in ids:
+            if node_id in seen:
+                raise ValueError(f"Node with ID {node_id} already exists")
+            seen.add(node_id)
+        
+        nodes = [
+            Node(id=node_id, name=name, activity=activity, interaction=interaction)
+            for node_id, name, activity, interaction
+            in zip(ids, names, activities, interactions)
+        ]
+        with self.bulk_insert():
+            for node in nodes:
+                self._insert_node(node)
+        self._notify_nodes('added', nodes)
+        return nodes
     
     def remove_node(self, node_id: int) -> bool:
         """
@@ -70,6 +219,8 @@ class Graph:
         
         # Remove all edges connected to this node
         self.edges = [e for e in self.edges if not e.contains_node(node_id)]
+        for neighbor_id in self._adjacency_list[node_id]:
+            del self._edge_index[_edge_key(node_id, neighbor_id)]
         
         # Update adjacency list - remove node and references to it
         del self._adjacency_list[node_id]
@@ -83,6 +234,8 @@ class Graph:
         
         # Remove the node
         del self.nodes[node_id]
+        self._touch()
+        self._notify_nodes('removed', node_id)
         
         return True
     
@@ -141,6 +294,7 @@ class Graph:
         
         edge = Edge(source=source, target=target)
         self.edges.append(edge)
+        self._edge_index[_edge_key(source_id, target_id)] = edge
         
         # Update adjacency list (undirected)
         self._adjacency_list[source_id].append(target_id)
@@ -152,9 +306,68 @@ class Graph:
         
         # Recalculate weight with updated connection counts
         edge.recalculate_weight()
+        self._touch()
         
         return edge
     
+    def add_edges_from(self, pairs: Sequence[Tuple[int, int]]) -> List[Edge]:
+        """
+        Add many edges at once.
+        
+        Pairs are applied in order with the same rules as add_edge (unknown
+        nodes, self-loops and duplicates are skipped), and each edge gets
+        the weight add_edge would have given it. Weights are computed in
+        one vectorized pass and the version is advanced only once.
+        
+        Args:
+            pairs: (source ID, target ID) pairs, e.g. an (E, 2) numpy array
+            
+        Returns:
+            The created edges, in input order
+        """
+        nodes = self.nodes
+        adjacency = self._adjacency_list
+        edge_index = self._edge_index
+        
+        added: List[Edge] = []
+        # Endpoint properties as add_edge sees them right after insertion
+        activities: List[float] = []
+        interactions: List[float] = []
+        connections: List[int] = []
+        
+        for source_id, target_id in np.asarray(pairs, dtype=np.int64).reshape(-1, 2).tolist():
+            if source_id not in nodes or target_id not in nodes or source_id == target_id:
+                continue
+            key = _edge_key(source_id, target_id)
+            if key in edge_index:
+                continue
+            
+            source = nodes[source_id]
+            target = nodes[target_id]
+            adjacency[source_id].append(target_id)
+            adjacency[target_id].append(source_id)
+            source.connection_count = len(adjacency[source_id])
+            target.connection_count = len(adjacency[target_id])
+            
+            # Placeholder weight skips the per-edge formula; set below
+            edge = Edge(source=source, target=target, weight=1.0)
+            edge_index[key] = edge
+            added.append(edge)
+            activities += (source.activity, target.activity)
+            interactions += (source.interaction, target.interaction)
+            connections += (source.connection_count, target.connection_count)
+        
+        if added:
+            self.edges.extend(added)
+            endpoints = np.arange(2 * len(added))
+            weights = calculate_weights_batch(activities, interactions, connections,
+                                              endpoints[0::2], endpoints[1::2])
+            for edge, weight in zip(added, weights.tolist()):
+                edge.weight = weight
+            self._touch()
+        
+        return added
+    
     def remove_edge(self, source_id: int, target_id: int) -> bool:
         """
         Remove an edge between two nodes.
@@ -166,13 +379,7 @@ class Graph:
         Returns:
             True if edge was removed, False if not found
         """
-        edge_to_remove = None
-        for edge in self.edges:
-            if ((edge.source.id == source_id and edge.target.id == target_id) or
-                (edge.source.id == target_id and edge.target.id == source_id)):
-                edge_to_remove = edge
-                break
-        
+        edge_to_remove = self._edge_index.pop(_edge_key(source_id, target_id), None)
         if edge_to_remove is None:
             return False
         
@@ -189,6 +396,7 @@ class Graph:
             self.nodes[source_id].connection_count = len(self._adjacency_list[source_id])
         if target_id in self.nodes:
             self.nodes[target_id].connection_count = len(self._adjacency_list[target_id])
+        self._touch()
         
         return True
     
@@ -203,7 +411,7 @@ class Graph:
         Returns:
             True if edge exists
         """
-        return target_id in self._adjacency_list.get(source_id, [])
+        return _edge_key(source_id, target_id) in self._edge_index
     
     def get_edge(self, source_id: int, target_id: int) -> Optional[Edge]:
         """
@@ -216,11 +424,7 @@ class Graph:
         Returns:
             Edge object or None if not found
         """
-        for edge in self.edges:
-            if ((edge.source.id == source_id and edge.target.id == target_id) or
-                (edge.source.id == target_id and edge.target.id == source_id)):
-                return edge
-        return None
+        return self._edge_index.get(_edge_key(source_id, target_id))
     
     def get_neighbors(self, node_id: int) -> List[Node]:
         """
@@ -245,7 +449,49 @@ class Graph:
         Returns:
             List of neighboring node IDs
         """
-        return self._adjacency_list.get(node_id, []).copy()
+        return list(self._adjacency_list.get(node_id, []))
+    
+    def adjacency_view(self) -> Dict[int, Tuple[int, ...]]:
+        """
+        Get a read-only adjacency view for tight neighbor loops.
+        
+        The view is rebuilt at most once per structural change and shared
+        between callers, so it must not be modified.
+        
+        Returns:
+            Dictionary mapping node IDs to tuples of neighbor IDs
+        """
+        if self._adj_cache is None or self._adj_cache[0] != self._version:
+            view = {nid: tuple(neighbors) for nid, neighbors in self._adjacency_list.items()}
+            self._adj_cache = (self._version, view)
+        return self._adj_cache[1]
+    
+    def csr_view(self) -> Tuple[List[int], np.ndarray, np.ndarray]:
+        """
+        Get the adjacency in CSR (compressed sparse row) form.
+        
+        Nodes are addressed by position; the neighbors of position p are
+        indices[indptr[p]:indptr[p + 1]], in adjacency order. Like
+        adjacency_view, the arrays are cached per structural change and
+        shared between callers, so they must not be modified.
+        
+        Returns:
+            Tuple of (node IDs by position, int32 indptr, int32 indices)
+        """
+        if self._csr_cache is None or self._csr_cache[0] != self._version:
+            adjacency = self.adjacency_view()
+            ids = list(adjacency)
+            position = {node_id: i for i, node_id in enumerate(ids)}
+            
+            indptr = np.zeros(len(ids) + 1, dtype=np.int32)
+            np.cumsum(np.fromiter((len(adjacency[node_id]) for node_id in ids),
+                                  dtype=np.int32, count=len(ids)), out=indptr[1:])
+            indices = np.fromiter(
+                (position[neighbor_id] for node_id in ids for neighbor_id in adjacency[node_id]),
+                dtype=np.int32, count=int(indptr[-1])
+            )
+            self._csr_cache = (self._version, (ids, indptr, indices))
+        return self._csr_cache[1]
     
     def get_degree(self, node_id: int) -> int:
         """
@@ -291,6 +537,41 @@ class Graph:
         
         return matrix, node_ids
     
+    def get_sparse_adjacency_matrix(self) -> Tuple[Tuple[np.ndarray, np.ndarray, np.ndarray], List[int]]:
+        """
+        Get the adjacency matrix in CSR (compressed sparse row) form.
+        
+        Same content as get_adjacency_matrix, but only the 2 * E nonzero
+        entries are stored. The (data, indices, indptr) triple is the
+        layout scipy.sparse.csr_matrix accepts directly.
+        
+        Returns:
+            Tuple of ((data, indices, indptr), node_ids), where row i holds
+            the weights data[indptr[i]:indptr[i + 1]] at the columns
+            indices[indptr[i]:indptr[i + 1]] (sorted), and node_ids is the
+            list of node IDs in order
+        """
+        node_ids = sorted(self.nodes.keys())
+        n = len(node_ids)
+        m = len(self.edges)
+        id_to_idx = {nid: i for i, nid in enumerate(node_ids)}
+        
+        sources = np.fromiter((id_to_idx[edge.source.id] for edge in self.edges),
+                              dtype=np.int32, count=m)
+        targets = np.fromiter((id_to_idx[edge.target.id] for edge in self.edges),
+                              dtype=np.int32, count=m)
+        weights = np.fromiter((edge.weight for edge in self.edges), dtype=np.float64, count=m)
+        
+        # Both directions of every undirected edge, ordered by row then column
+        rows = np.concatenate((sources, targets))
+        cols = np.concatenate((targets, sources))
+        order = np.lexsort((cols, rows))
+        
+        indptr = np.zeros(n + 1, dtype=np.int32)
+        np.cumsum(np.bincount(rows, minlength=n), out=indptr[1:])
+        
+        return (np.concatenate((weights, weights))[order], cols[order], indptr), node_ids
+    
     def get_node_count(self) -> int:
         """Get the number of nodes in the graph."""
         return len(self.nodes)
@@ -334,10 +615,17 @@ class Graph:
     
     def clear(self) -> None:
         """Clear the entire graph."""
+        self._clear_contents()
+        self._notify_nodes('reset')
+    
+    def _clear_contents(self) -> None:
+        """Remove all nodes and edges without notifying observers."""
         self.nodes.clear()
         self.edges.clear()
         self._adjacency_list.clear()
+        self._edge_index.clear()
         self._next_id = 1
+        self._touch()
     
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -363,33 +651,109 @@ class Graph:
             New Graph instance
         """
         graph = cls()
+        graph.load_from_dict(data)
+        return graph
+    
+    def load_from_dict(self, data: Dict[str, Any]) -> None:
+        """
+        Replace the contents of this graph with serialized graph data.
         
-        # Add nodes first
-        for node_data in data.get('nodes', []):
-            node = Node.from_dict(node_data)
-            graph.add_node(node)
+        The graph object keeps its identity, so views holding a reference
+        to it stay valid. Nodes are validated before anything is cleared.
+        
+        Args:
+            data: Dictionary containing graph data
+            
+        Raises:
+            ValueError: If two nodes share the same ID
+        """
+        nodes = [Node.from_dict(node_data) for node_data in data.get('nodes', [])]
+        node_map = {node.id: node for node in nodes}
+        if len(node_map) != len(nodes):
+            raise ValueError("Duplicate node IDs in graph data")
+        
+        with self.bulk_insert():
+            self._clear_contents()
+            self.nodes.update(node_map)
+            self._adjacency_list.update((nid, []) for nid in node_map)
+            if node_map:
+                self._next_id = max(node_map) + 1
+            
+            for edge_data in data.get('edges', []):
+                self.add_edge(edge_data['source_id'], edge_data['target_id'])
+        self._notify_nodes('reset')
+    
+    def load_from_graph(self, other: 'Graph') -> None:
+        """
+        Take over the contents of another graph in place.
         
-        # Add edges
-        for edge_data in data.get('edges', []):
-            graph.add_edge(edge_data['source_id'], edge_data['target_id'])
+        Used to adopt a graph built elsewhere (e.g. on a loader thread)
+        without replacing this object. The other graph must not be used
+        afterwards.
         
-        return graph
+        Args:
+            other: Graph whose nodes and edges are moved into this one
+        """
+        self.nodes = other.nodes
+        self.edges = other.edges
+        self._adjacency_list = other._adjacency_list
+        self._edge_index = other._edge_index
+        self._next_id = other._next_id
+        self._version = max(self._version, other._version) + 1
+        self._notify_nodes('reset')
     
     def get_statistics(self) -> Dict[str, Any]:
         """
         Get comprehensive graph statistics.
         
+        Degree statistics and the connected component count are computed
+        in a single sweep over the adjacency list. The result is cached
+        until the graph structure changes.
+        
         Returns:
             Dictionary containing various graph metrics
         """
-        return {
-            'node_count': self.get_node_count(),
-            'edge_count': self.get_edge_count(),
+        if self._stats_cache is not None and self._stats_cache[0] == self._version:
+            return dict(self._stats_cache[1])
+        
+        adjacency = self._adjacency_list
+        visited: Set[int] = set()
+        components = 0
+        total_degree = 0
+        max_degree = 0
+        min_degree = None
+        
+        for node_id, neighbors in adjacency.items():
+            degree = len(neighbors)
+            total_degree += degree
+            if degree > max_degree:
+                max_degree = degree
+            if min_degree is None or degree < min_degree:
+                min_degree = degree
+            
+            if node_id not in visited:
+                # BFS over a new component
+                components += 1
+                visited.add(node_id)
+                queue = deque((node_id,))
+                while queue:
+                    for neighbor in adjacency[queue.popleft()]:
+                        if neighbor not in visited:
+                            visited.add(neighbor)
+                            queue.append(neighbor)
+        
+        node_count = len(self.nodes)
+        stats = {
+            'node_count': node_count,
+            'edge_count': len(self.edges),
             'density': round(self.get_density(), 4),
-            'average_degree': round(self.get_average_degree(), 2),
-            'max_degree': max((self.get_degree(nid) for nid in self.nodes), default=0),
-            'min_degree': min((self.get_degree(nid) for nid in self.nodes), default=0)
+            'average_degree': round(total_degree / node_count, 2) if node_count else 0.0,
+            'max_degree': max_degree,
+            'min_degree': min_degree or 0,
+            'component_count': components
         }
+        self._stats_cache = (self._version, stats)
+        return dict(stats)
     
     def __repr__(self):
         return f"Graph(nodes={len(self.nodes)}, edges={len(self.edges)})"
@@ -1,5 +1,6 @@
-from .force_directed import ForceDirectedLayout
+from .force_directed import ForceDirectedLayout, physics_step
+from .init_layout import circle_init
 
-__all__ = ['ForceDirectedLayout']
+__all__ = ['ForceDirectedLayout', 'physics_step', 'circle_init']
 
 
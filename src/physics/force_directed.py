@@ -4,10 +4,133 @@ Force-directed graph layout algorithm.
 import math
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 if TYPE_CHECKING:
     from ..models.graph import Graph
 
 
+# Rows of the pairwise repulsion computed at once (bounds temporary memory)
+ARRAY_BLOCK_SIZE = 512
+
+
+def physics_step(pos: np.ndarray, vel: np.ndarray, src_idx: np.ndarray,
+                 dst_idx: np.ndarray, repulsion: float, attraction: float,
+                 damping: float, min_distance: float, max_velocity: float,
+                 temperature: float) -> None:
+    """
+    Advance node positions by one force-directed step, in place.
+    
+    Same forces as ForceDirectedLayout.step() expressed as NumPy array
+    operations: all-pairs repulsion, edge springs, center gravity,
+    velocity cap, temperature and damping.
+    
+    Args:
+        pos: Node positions, shape (n, 2); updated in place
+        vel: Node velocities, shape (n, 2); overwritten in place
+        src_idx: Row index of each edge's source node
+        dst_idx: Row index of each edge's target node
+        repulsion: Repulsion strength (Coulomb constant)
+        attraction: Attraction strength (spring constant)
+        damping: Velocity damping factor
+        min_distance: Distance below which repulsion stops growing
+        max_velocity: Velocity cap
+        temperature: Current annealing temperature
+    """
+    n = len(pos)
+    
+    # Reset forces
+    vel[:] = 0.0
+    
+    # Repulsion forces (all pairs), F = k / d^2 along the separation
+    for start in range(0, n, ARRAY_BLOCK_SIZE):
+        block = pos[start:start + ARRAY_BLOCK_SIZE]
+        diff = block[:, None, :] - pos[None, :, :]
+        dist = np.sqrt((diff * diff).sum(axis=2))
+        np.maximum(dist, min_distance, out=dist)
+        vel[start:start + len(block)] += (
+            diff * (repulsion / dist ** 3)[:, :, None]
+        ).sum(axis=1)
+    
+    # Attraction forces (connected nodes), F = k * d towards each other
+    if len(src_idx):
+        spring = attraction * (pos[dst_idx] - pos[src_idx])
+        np.add.at(vel, src_idx, spring)
+        np.subtract.at(vel, dst_idx, spring)
+    
+    # Center gravity (weak force pulling to center)
+    to_center = pos.mean(axis=0) - pos
+    dist = np.sqrt((to_center * to_center).sum(axis=1))
+    moving = dist > 0
+    vel[moving] += (0.1 * temperature) * to_center[moving] / dist[moving, None]
+    
+    # Cap velocity
+    speed = np.sqrt((vel * vel).sum(axis=1))
+    fast = speed > max_velocity
+    vel[fast] *= (max_velocity / speed[fast])[:, None]
+    
+    # Apply temperature and update positions with damping
+    vel *= temperature
+    pos += vel * damping
+
+
+class _QuadCell:
+    """
+    Square region of a Barnes-Hut quadtree.
+    
+    Tracks the number of nodes inside the region (mass) and their center
+    of mass. Leaves hold the nodes directly; internal cells have up to
+    four child quadrants.
+    """
+    
+    MIN_HALF_SIZE = 1e-3  # Stop subdividing for (nearly) coincident nodes
+    
+    __slots__ = ('cx', 'cy', 'half', 'mass', 'com_x', 'com_y', 'bodies', 'children')
+    
+    def __init__(self, cx: float, cy: float, half: float):
+        self.cx = cx
+        self.cy = cy
+        self.half = half
+        self.mass = 0
+        self.com_x = 0.0
+        self.com_y = 0.0
+        self.bodies = []
+        self.children = None
+    
+    def insert(self, node) -> None:
+        """Insert a node, subdividing the cell when needed."""
+        mass = self.mass
+        self.com_x = (self.com_x * mass + node.x) / (mass + 1)
+        self.com_y = (self.com_y * mass + node.y) / (mass + 1)
+        self.mass = mass + 1
+        
+        if self.children is None:
+            self.bodies.append(node)
+            if len(self.bodies) > 1 and self.half > self.MIN_HALF_SIZE:
+                bodies = self.bodies
+                self.bodies = []
+                self.children = [None, None, None, None]
+                for body in bodies:
+                    self._insert_child(body)
+            return
+        
+        self._insert_child(node)
+    
+    def _insert_child(self, node) -> None:
+        """Insert a node into the matching child quadrant."""
+        index = (node.x >= self.cx) + 2 * (node.y >= self.cy)
+        child = self.children[index]
+        if child is None:
+            half = self.half / 2
+            child = _QuadCell(
+                self.cx + (half if index & 1 else -half),
+                self.cy + (half if index & 2 else -half),
+                half
+            )
+            self.children[index] = child
+        child.insert(node)
+
+
 class ForceDirectedLayout:
     """
     Force-directed layout using Fruchterman-Reingold algorithm.
@@ -56,6 +179,61 @@ class ForceDirectedLayout:
             for node2 in nodes[i + 1:]:
                 self._apply_repulsion(node1, node2)
         
+        self._finish_step(graph, nodes)
+    
+    def step_bh(self, graph: 'Graph', theta: float = 1.2) -> None:
+        """
+        Perform one simulation step using Barnes-Hut repulsion.
+        
+        Repulsion from distant groups of nodes is approximated by their
+        center of mass, reducing the cost from O(n^2) to O(n log n).
+        
+        Args:
+            graph: Graph to simulate
+            theta: Opening angle; larger values are faster but less exact
+        """
+        if not graph or not graph.nodes:
+            return
+        
+        self.graph = graph
+        nodes = list(graph.nodes.values())
+        
+        # Reset forces
+        for node in nodes:
+            node.vx = 0
+            node.vy = 0
+        
+        root = self._build_quadtree(nodes)
+        for node in nodes:
+            self._apply_bh_repulsion(node, root, theta)
+        
+        self._finish_step(graph, nodes)
+    
+    def step_arrays(self, pos: np.ndarray, vel: np.ndarray,
+                    src_idx: np.ndarray, dst_idx: np.ndarray) -> None:
+        """
+        Perform one simulation step on position/velocity arrays in place.
+        
+        Vectorized equivalent of step() for structure-of-arrays callers.
+        
+        Args:
+            pos: Node positions, shape (n, 2); updated in place
+            vel: Node velocities, shape (n, 2); overwritten in place
+            src_idx: Row index of each edge's source node
+            dst_idx: Row index of each edge's target node
+        """
+        if len(pos) == 0:
+            return
+        
+        physics_step(pos, vel, src_idx, dst_idx, self.repulsion, self.attraction,
+                     self.damping, self.min_distance, self.max_velocity,
+                     self.temperature)
+        
+        # Cool down
+        self.temperature = max(0.01, self.temperature * self.cooling_rate)
+    
+    def _finish_step(self, graph: 'Graph', nodes: list) -> None:
+        """Apply attraction and gravity, then integrate node positions."""
         # Calculate attraction forces (connected nodes)
         for edge in graph.edges:
             self._apply_attraction(edge.source, edge.target)
@@ -122,6 +300,63 @@ class ForceDirectedLayout:
             node2.vx -= fx
             node2.vy -= fy
     
+    @staticmethod
+    def _build_quadtree(nodes: list) -> _QuadCell:
+        """Build a quadtree covering all node positions."""
+        min_x = min(n.x for n in nodes)
+        max_x = max(n.x for n in nodes)
+        min_y = min(n.y for n in nodes)
+        max_y = max(n.y for n in nodes)
+        
+        half = max(max_x - min_x, max_y - min_y) / 2 + 1.0
+        root = _QuadCell((min_x + max_x) / 2, (min_y + max_y) / 2, half)
+        for node in nodes:
+            root.insert(node)
+        return root
+    
+    def _apply_bh_repulsion(self, node, root: _QuadCell, theta: float) -> None:
+        """
+        Accumulate repulsion on a single node by traversing the quadtree.
+        
+        A cell is treated as one body when size / distance < theta.
+        """
+        min_distance = self.min_distance
+        repulsion = self.repulsion
+        fx_total = 0.0
+        fy_total = 0.0
+        
+        stack = [root]
+        while stack:
+            cell = stack.pop()
+            
+            if cell.children is None:
+                # Leaf: exact interaction with each contained node
+                sources = [(b.x, b.y, 1) for b in cell.bodies if b is not node]
+            else:
+                dx = node.x - cell.com_x
+                dy = node.y - cell.com_y
+                dist = math.sqrt(dx * dx + dy * dy)
+                if dist > 0 and (2 * cell.half) / dist < theta:
+                    sources = [(cell.com_x, cell.com_y, cell.mass)]
+                else:
+                    stack.extend(c for c in cell.children if c is not None)
+                    continue
+            
+            for sx, sy, mass in sources:
+                dx = node.x - sx
+                dy = node.y - sy
+                dist = math.sqrt(dx * dx + dy * dy)
+                if dist < min_distance:
+                    dist = min_distance
+                
+                # Same Coulomb force as _apply_repulsion, scaled by cell mass
+                force = repulsion * mass / (dist * dist)
+                fx_total += force * dx / dist
+                fy_total += force * dy / dist
+        
+        node.vx += fx_total
+        node.vy += fy_total
+    
     def _apply_attraction(self, node1, node2) -> None:
         """
         Apply attraction force between connected nodes (Hooke's law).
@@ -0,0 +1,32 @@
+"""
+Initial node placement for the force-directed layout.
+"""
+from typing import Optional
+
+import numpy as np
+
+
+def circle_init(n: int, cx: float, cy: float, radius: float,
+                jitter: float, seed: Optional[int] = None) -> np.ndarray:
+    """
+    Place n points evenly on a circle with random jitter.
+    
+    Args:
+        n: Number of points
+        cx: Circle center x coordinate
+        cy: Circle center y coordinate
+        radius: Circle radius
+        jitter: Maximum random offset applied to each coordinate
+        seed: Optional random seed for reproducible layouts
+    
+    Returns:
+        Array of shape (n, 2) holding (x, y) positions
+    """
+    rng = np.random.default_rng(seed)
+    angles = np.linspace(0, 2 * np.pi, n, endpoint=False)
+    
+    out = np.empty((n, 2))
+    out[:, 0] = cx + radius * np.cos(angles)
+    out[:, 1] = cy + radius * np.sin(angles)
+    out += rng.uniform(-jitter, jitter, (n, 2))
+    return out
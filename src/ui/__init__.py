@@ -4,6 +4,8 @@ from .control_panel import ControlPanel
 from .stats_panel import StatsPanel
 from .algorithm_panel import AlgorithmPanel
 from .node_dialog import NodeDialog
+from .node_list_model import NodeListModel
+from .json_io_worker import JsonIoWorker
 from .styles import DarkTheme
 
 __all__ = [
@@ -13,6 +15,8 @@ __all__ = [
     'StatsPanel',
     'AlgorithmPanel',
     'NodeDialog',
+    'NodeListModel',
+    'JsonIoWorker',
     'DarkTheme'
 ]
 
@@ -6,7 +6,7 @@ from PyQt6.QtWidgets import (
     QPushButton, QComboBox, QTableWidget, QTableWidgetItem,
     QHeaderView, QSpinBox, QFrame, QSplitter
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QTimer
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QSignalBlocker
 from PyQt6.QtGui import QColor
 
 from ..models.graph import Graph
@@ -148,7 +148,7 @@ class AlgorithmPanel(QWidget):
         result_layout.addWidget(self.result_label)
         
         self.time_label = QLabel("Süre: -")
-        self.time_label.setStyleSheet(f"color: {DarkTheme.COLORS['neon_green']};")
+        self.time_label.setStyleSheet(f"color: {DarkTheme.NEON_GREEN};")
         result_layout.addWidget(self.time_label)
         
         top_layout.addWidget(result_group)
@@ -169,13 +169,14 @@ class AlgorithmPanel(QWidget):
     
     def _refresh_combos(self):
         """Refresh node selection combo boxes."""
-        self.start_combo.clear()
-        self.end_combo.clear()
-        
-        for node in self.graph.nodes.values():
-            item_text = f"{node.id} - {node.name}"
-            self.start_combo.addItem(item_text)
-            self.end_combo.addItem(item_text)
+        items = [f"{node.id} - {node.name}" for node in self.graph.nodes.values()]
+        
+        # Refill each combo in one insert without per-item change signals
+        for combo in (self.start_combo, self.end_combo):
+            blocker = QSignalBlocker(combo)
+            combo.clear()
+            combo.addItems(items)
+            blocker.unblock()
     
     def _get_selected_start_id(self) -> int:
         """Get selected start node ID."""
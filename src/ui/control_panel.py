@@ -3,16 +3,36 @@ Control panel for graph manipulation.
 """
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGroupBox, QLabel,
-    QPushButton, QLineEdit, QDoubleSpinBox,
-    QComboBox, QFormLayout
+    QPushButton, QLineEdit, QDoubleSpinBox, QSlider,
+    QComboBox, QFormLayout, QCheckBox
 )
 from PyQt6.QtCore import Qt, pyqtSignal
 
 from ..models.graph import Graph
 from ..models.node import Node
+from .node_list_model import NodeListModel
 from .styles import DarkTheme
 
 
+class ActivitySlider(QSlider):
+    """
+    Horizontal slider for activity input (0.0 - 1.0 in 0.1 steps).
+    """
+    
+    def __init__(self, value: float = 0.5):
+        super().__init__(Qt.Orientation.Horizontal)
+        self.setRange(0, 10)
+        self.setSingleStep(1)
+        self.setPageStep(1)
+        self.setTickInterval(1)
+        self.setTickPosition(QSlider.TickPosition.TicksBelow)
+        self.setValue(round(value * 10))
+    
+    def activity(self) -> float:
+        """Get the activity value as a float between 0.0 and 1.0."""
+        return self.value() / 10.0
+
+
 class ControlPanel(QWidget):
     """
     Control panel for adding/editing nodes and edges.
@@ -22,13 +42,25 @@ class ControlPanel(QWidget):
     node_added = pyqtSignal(object)  # Node
     edge_added = pyqtSignal(object)  # Edge
     auto_layout_requested = pyqtSignal()
+    physics_toggled = pyqtSignal(bool)
     
     def __init__(self, graph: Graph):
         super().__init__()
-        self.graph = graph
+        self._graph = graph
+        self._node_model = NodeListModel(graph, self)
         self._selected_node = None
         self._init_ui()
     
+    @property
+    def graph(self) -> Graph:
+        """The graph edited by this panel."""
+        return self._graph
+    
+    @graph.setter
+    def graph(self, graph: Graph):
+        self._graph = graph
+        self._node_model.set_graph(graph)
+    
     def _init_ui(self):
         """Initialize the UI."""
         layout = QVBoxLayout(self)
@@ -63,30 +95,23 @@ class ControlPanel(QWidget):
         group = QGroupBox("Düğüm İşlemleri")
         layout = QVBoxLayout(group)
         
-        # Node name input
-        name_layout = QHBoxLayout()
-        name_layout.addWidget(QLabel("İsim:"))
+        # Name and properties in a single form
+        form = QFormLayout()
+        
         self.node_name_input = QLineEdit()
         self.node_name_input.setPlaceholderText("Kullanıcı adı")
-        name_layout.addWidget(self.node_name_input)
-        layout.addLayout(name_layout)
+        form.addRow("İsim:", self.node_name_input)
         
-        # Properties
-        props_layout = QFormLayout()
-        
-        self.activity_input = QDoubleSpinBox()
-        self.activity_input.setRange(0.0, 1.0)
-        self.activity_input.setSingleStep(0.1)
-        self.activity_input.setValue(0.5)
-        props_layout.addRow("Aktivite:", self.activity_input)
+        self.activity_input = ActivitySlider(0.5)
+        form.addRow("Aktivite:", self.activity_input)
         
         self.interaction_input = QDoubleSpinBox()
         self.interaction_input.setRange(0, 100)
         self.interaction_input.setSingleStep(1)
         self.interaction_input.setValue(10)
-        props_layout.addRow("Etkileşim:", self.interaction_input)
+        form.addRow("Etkileşim:", self.interaction_input)
         
-        layout.addLayout(props_layout)
+        layout.addLayout(form)
         
         # Add button
         add_node_btn = QPushButton("+ Düğüm Ekle")
@@ -105,6 +130,7 @@ class ControlPanel(QWidget):
         source_layout = QHBoxLayout()
         source_layout.addWidget(QLabel("Kaynak:"))
         self.source_combo = QComboBox()
+        self.source_combo.setModel(self._node_model)
         self.source_combo.setMinimumWidth(100)
         source_layout.addWidget(self.source_combo)
         layout.addLayout(source_layout)
@@ -112,6 +138,7 @@ class ControlPanel(QWidget):
         target_layout = QHBoxLayout()
         target_layout.addWidget(QLabel("Hedef:"))
         self.target_combo = QComboBox()
+        self.target_combo.setModel(self._node_model)
         self.target_combo.setMinimumWidth(100)
         target_layout.addWidget(self.target_combo)
         layout.addLayout(target_layout)
@@ -121,11 +148,6 @@ class ControlPanel(QWidget):
         add_edge_btn.clicked.connect(self._add_edge)
         layout.addWidget(add_edge_btn)
         
-        # Refresh combos button
-        refresh_btn = QPushButton("Listeyi Yenile")
-        refresh_btn.clicked.connect(self._refresh_combos)
-        layout.addWidget(refresh_btn)
-        
         return group
     
     def _create_layout_group(self) -> QGroupBox:
@@ -136,9 +158,17 @@ class ControlPanel(QWidget):
         # Auto layout button
         auto_btn = QPushButton("Otomatik Yerleşim")
         auto_btn.setObjectName("primaryButton")
-        auto_btn.clicked.connect(self.auto_layout_requested.emit)
+        # Queued so the button is released before the layout work starts
+        auto_btn.clicked.connect(
+            self.auto_layout_requested, Qt.ConnectionType.QueuedConnection
+        )
         layout.addWidget(auto_btn)
         
+        # Live physics toggle
+        physics_check = QCheckBox("Canlı Fizik")
+        physics_check.toggled.connect(self.physics_toggled)
+        layout.addWidget(physics_check)
+        
         # Help text
         help_label = QLabel("Graf yapısına göre düğümleri\notomatik olarak konumlandırır")
         help_label.setStyleSheet("color: #6c7a89; font-size: 10px;")
@@ -172,7 +202,7 @@ class ControlPanel(QWidget):
     def _add_node(self):
         """Add a new node to the graph."""
         name = self.node_name_input.text().strip()
-        activity = self.activity_input.value()
+        activity = self.activity_input.activity()
         interaction = self.interaction_input.value()
         
         try:
@@ -183,38 +213,21 @@ class ControlPanel(QWidget):
             )
             
             self.node_name_input.clear()
-            self._refresh_combos()
             self.node_added.emit(node)
         except ValueError as e:
             pass  # Node already exists
     
     def _add_edge(self):
         """Add a new edge to the graph."""
-        source_text = self.source_combo.currentText()
-        target_text = self.target_combo.currentText()
+        source_id = self.source_combo.currentData(Qt.ItemDataRole.UserRole)
+        target_id = self.target_combo.currentData(Qt.ItemDataRole.UserRole)
         
-        if not source_text or not target_text:
+        if source_id is None or target_id is None:
             return
         
-        try:
-            source_id = int(source_text.split(" ")[0])
-            target_id = int(target_text.split(" ")[0])
-            
-            edge = self.graph.add_edge(source_id, target_id)
-            if edge:
-                self.edge_added.emit(edge)
-        except (ValueError, IndexError):
-            pass
-    
-    def _refresh_combos(self):
-        """Refresh the node selection combo boxes."""
-        self.source_combo.clear()
-        self.target_combo.clear()
-        
-        for node in self.graph.nodes.values():
-            item_text = f"{node.id} - {node.name}"
-            self.source_combo.addItem(item_text)
-            self.target_combo.addItem(item_text)
+        edge = self.graph.add_edge(source_id, target_id)
+        if edge:
+            self.edge_added.emit(edge)
     
     def set_selected_node(self, node):
         """Update the selected node info display."""
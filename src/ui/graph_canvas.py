@@ -3,23 +3,53 @@ Graph visualization canvas using QGraphicsView.
 """
 from PyQt6.QtWidgets import (
     QGraphicsView, QGraphicsScene, QGraphicsEllipseItem,
-    QGraphicsLineItem, QGraphicsTextItem, QMenu, QGraphicsItem
+    QGraphicsLineItem, QGraphicsPathItem, QGraphicsTextItem, QMenu, QGraphicsItem
 )
 from PyQt6.QtCore import Qt, QTimer, QPointF, QRectF, pyqtSignal
 from PyQt6.QtGui import (
-    QPen, QBrush, QColor, QPainter, QFont,
+    QPen, QBrush, QColor, QPainter, QPainterPath, QFont, QPixmap,
     QRadialGradient, QWheelEvent, QMouseEvent, QContextMenuEvent, QKeyEvent
 )
 import math
 import time
+from collections import defaultdict
 from typing import Dict, Optional, List, Tuple
 
+import numpy as np
+
 from ..models.graph import Graph
 from ..models.node import Node
 from ..physics.force_directed import ForceDirectedLayout
+from ..physics.init_layout import circle_init
 from .styles import DarkTheme
 
 
+# Shared label styling for every node
+LABEL_FONT = QFont("Segoe UI", 12, QFont.Weight.ExtraBold)
+LABEL_COLOR = QColor(DarkTheme.TEXT_PRIMARY)
+SELECTED_PEN_COLOR = QColor(DarkTheme.NEON_GREEN)
+HOVER_PEN_COLOR = QColor(DarkTheme.NEON_BLUE)
+
+# Node styles per visual state:
+# (state, gradient stops as (position, tint factor, darker), pen width,
+#  fixed pen color, pen tint as (factor, darker) when no fixed color)
+# A tint factor of None means the base color itself.
+_NORMAL_STYLE = ('normal', ((0, 120, False), (0.7, None, False), (1, 130, True)),
+                 2, None, (150, True))
+_HIGHLIGHTED_STYLE = ('highlighted', ((0, 160, False), (0.7, 120, False), (1, None, False)),
+                      3, None, (150, False))
+_HOVERED_STYLE = ('hovered', ((0, 140, False), (0.7, None, False), (1, 110, True)),
+                  3, HOVER_PEN_COLOR, None)
+_SELECTED_STYLE = ('selected', ((0, 150, False), (0.7, None, False), (1, 120, True)),
+                   4, SELECTED_PEN_COLOR, None)
+
+# Indexed by (selected << 2) | (hovered << 1) | highlighted
+_STATE_TABLE = (
+    _NORMAL_STYLE, _HIGHLIGHTED_STYLE, _HOVERED_STYLE, _HOVERED_STYLE,
+    _SELECTED_STYLE, _SELECTED_STYLE, _SELECTED_STYLE, _SELECTED_STYLE,
+)
+
+
 class NodeItem(QGraphicsEllipseItem):
     """
     Visual representation of a node in the graph.
@@ -27,6 +57,12 @@ class NodeItem(QGraphicsEllipseItem):
     
     BASE_RADIUS = 25
     
+    # Qt paint objects shared by all node items (colors rarely change)
+    _COLOR_CACHE: Dict[Tuple[int, int, int], QColor] = {}
+    _PEN_CACHE: Dict[Tuple[int, int], QPen] = {}
+    _BRUSH_CACHE: Dict[Tuple[Tuple[int, int, int], str, float], QBrush] = {}
+    _TINT_CACHE: Dict[Tuple[Tuple[int, int, int], int, bool], QColor] = {}
+    
     def __init__(self, node: Node, canvas: 'GraphCanvas'):
         self.node = node
         self.canvas = canvas
@@ -42,72 +78,112 @@ class NodeItem(QGraphicsEllipseItem):
         self.setCursor(Qt.CursorShape.PointingHandCursor)
         self.setZValue(10)  # Above edges
         
-        # Label
-        self.label = QGraphicsTextItem(node.name, self)
-        self.label.setDefaultTextColor(QColor(DarkTheme.COLORS['text_primary']))
-        font = QFont("Segoe UI", 12, QFont.Weight.ExtraBold)
-        self.label.setFont(font)
-        self._center_label()
+        # Render the gradient once to a pixmap and blit it on redraws;
+        # setBrush/setPen invalidate the cache when the appearance changes
+        self.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
+        
+        # Label (created lazily, only once it can actually be seen)
+        self.label: Optional[QGraphicsTextItem] = None
+        if canvas.labels_visible:
+            self._ensure_label()
         
         # Initial appearance
         self._is_hovered = False
         self.update_appearance()
     
+    def _ensure_label(self) -> QGraphicsTextItem:
+        """Create the label text item on first use."""
+        if self.label is None:
+            self.label = QGraphicsTextItem(self.node.name, self)
+            self.label.setDefaultTextColor(LABEL_COLOR)
+            self.label.setFont(LABEL_FONT)
+            self._center_label()
+        return self.label
+    
+    def set_label_visible(self, visible: bool):
+        """Show or hide the label, creating it if needed."""
+        if visible:
+            self._ensure_label().setVisible(True)
+        elif self.label is not None:
+            self.label.setVisible(False)
+    
     def _center_label(self):
         """Center the label below the node."""
+        if self.label is None:
+            return
         rect = self.label.boundingRect()
         self.label.setPos(-rect.width() / 2, self.radius + 5)
     
+    @classmethod
+    def _get_color(cls, rgb: Tuple[int, int, int]) -> QColor:
+        """Get a shared QColor for an RGB tuple."""
+        color = cls._COLOR_CACHE.get(rgb)
+        if color is None:
+            color = cls._COLOR_CACHE[rgb] = QColor(*rgb)
+        return color
+    
+    @classmethod
+    def _tint(cls, rgb: Tuple[int, int, int], factor: int, darker: bool = False) -> QColor:
+        """Get a shared lighter (or darker) variant of an RGB color."""
+        key = (rgb, factor, darker)
+        color = cls._TINT_CACHE.get(key)
+        if color is None:
+            base = cls._get_color(rgb)
+            color = base.darker(factor) if darker else base.lighter(factor)
+            cls._TINT_CACHE[key] = color
+        return color
+    
+    @classmethod
+    def _get_pen(cls, color: QColor, width: int) -> QPen:
+        """Get a shared QPen for a color and width."""
+        key = (color.rgba(), width)
+        pen = cls._PEN_CACHE.get(key)
+        if pen is None:
+            pen = cls._PEN_CACHE[key] = QPen(color, width)
+        return pen
+    
+    def _get_brush(self, rgb: Tuple[int, int, int], style: tuple) -> QBrush:
+        """Get a shared gradient brush for a base color and visual state."""
+        state, stops = style[0], style[1]
+        key = (rgb, state, self.radius)
+        brush = self._BRUSH_CACHE.get(key)
+        if brush is not None:
+            return brush
+        
+        gradient = QRadialGradient(0, 0, self.radius)
+        for position, factor, darker in stops:
+            if factor is None:
+                gradient.setColorAt(position, self._get_color(rgb))
+            else:
+                gradient.setColorAt(position, self._tint(rgb, factor, darker))
+        
+        brush = self._BRUSH_CACHE[key] = QBrush(gradient)
+        return brush
+    
     def update_appearance(self):
         """Update node visual appearance based on state."""
         node = self.node
         
         # Determine color
         if node.is_highlighted and node.highlight_color:
-            r, g, b = node.highlight_color
+            rgb = tuple(node.highlight_color)
         else:
-            r, g, b = node.color
+            rgb = tuple(node.color)
         
-        color = QColor(r, g, b)
+        # Look up the style for the state bits (selected > hovered > highlighted)
+        selected = self.isSelected() or node.is_selected
+        style = _STATE_TABLE[(selected << 2) | (self._is_hovered << 1) | bool(node.is_highlighted)]
+        _, _, pen_width, pen_color, pen_tint = style
+        if pen_color is None:
+            pen_color = self._tint(rgb, *pen_tint)
         
-        # Create gradient
-        gradient = QRadialGradient(0, 0, self.radius)
+        self.setBrush(self._get_brush(rgb, style))
+        self.setPen(self._get_pen(pen_color, pen_width))
         
-        if self.isSelected() or node.is_selected:
-            # Selected state - bright glow
-            gradient.setColorAt(0, color.lighter(150))
-            gradient.setColorAt(0.7, color)
-            gradient.setColorAt(1, color.darker(120))
-            pen_width = 4
-            pen_color = QColor(DarkTheme.COLORS['neon_green'])
-        elif self._is_hovered:
-            # Hovered state
-            gradient.setColorAt(0, color.lighter(140))
-            gradient.setColorAt(0.7, color)
-            gradient.setColorAt(1, color.darker(110))
-            pen_width = 3
-            pen_color = QColor(DarkTheme.COLORS['neon_blue'])
-        elif node.is_highlighted:
-            # Highlighted state (algorithm visualization)
-            gradient.setColorAt(0, color.lighter(160))
-            gradient.setColorAt(0.7, color.lighter(120))
-            gradient.setColorAt(1, color)
-            pen_width = 3
-            pen_color = color.lighter(150)
-        else:
-            # Normal state
-            gradient.setColorAt(0, color.lighter(120))
-            gradient.setColorAt(0.7, color)
-            gradient.setColorAt(1, color.darker(130))
-            pen_width = 2
-            pen_color = color.darker(150)
-        
-        self.setBrush(QBrush(gradient))
-        self.setPen(QPen(pen_color, pen_width))
-        
-        # Update label
-        self.label.setPlainText(node.name)
-        self._center_label()
+        # Update label only when the name changed (text layout is costly)
+        if self.label is not None and self.label.toPlainText() != node.name:
+            self.label.setPlainText(node.name)
+            self._center_label()
     
     def set_size_by_degree(self, degree: int, max_degree: int):
         """Scale node size based on degree centrality."""
@@ -128,10 +204,11 @@ class NodeItem(QGraphicsEllipseItem):
             pos = value
             self.node.x = pos.x()
             self.node.y = pos.y()
+            self.canvas._set_position(self.node.id, self.node.x, self.node.y)
             # Stop velocity when dragging
             self.node.reset_velocity()
-            # Update connected edges
-            self.canvas.update_edges_for_node(self.node.id)
+            # Update connected edges (coalesced per event loop pass)
+            self.canvas._schedule_edge_update(self.node.id)
         
         return super().itemChange(change, value)
     
@@ -158,11 +235,28 @@ class NodeItem(QGraphicsEllipseItem):
 class EdgeItem(QGraphicsLineItem):
     """
     Visual representation of an edge in the graph.
+    
+    Highlighted edges and the edges of nodes being dragged are added to the
+    scene individually; all others are drawn by the _EdgeBucket sharing
+    their style.
     """
     
+    # Default colors as RGB tuples
+    HIGHLIGHT_RGB = QColor(DarkTheme.NEON_PURPLE).getRgb()[:3]
+    NORMAL_RGB = QColor(DarkTheme.BORDER_LIGHT).getRgb()[:3]
+    
+    # Opacity is quantized so edges fall into a small number of styles
+    ALPHA_STEP = 16
+    
+    # Pens shared by all edge items, keyed by (r, g, b, alpha, width)
+    _PEN_CACHE: Dict[Tuple[int, int, int, int, int], QPen] = {}
+    
     def __init__(self, edge, canvas: 'GraphCanvas'):
         self.edge = edge
         self.canvas = canvas
+        self.bucket: Optional['_EdgeBucket'] = None
+        self.style_key: Optional[Tuple[int, int, int, int, int]] = None
+        self.detached = False  # Drawn individually while an endpoint is dragged
         
         super().__init__()
         
@@ -175,26 +269,55 @@ class EdgeItem(QGraphicsLineItem):
         x1, y1 = self.edge.source.x, self.edge.source.y
         x2, y2 = self.edge.target.x, self.edge.target.y
         self.setLine(x1, y1, x2, y2)
+        if self.bucket is not None:
+            self.canvas._mark_bucket_dirty(self.bucket)
     
     def update_appearance(self):
         """Update edge visual appearance."""
         if self.edge.is_highlighted:
-            if self.edge.highlight_color:
-                r, g, b = self.edge.highlight_color
-                color = QColor(r, g, b)
-            else:
-                color = QColor(DarkTheme.COLORS['neon_purple'])
+            r, g, b = self.edge.highlight_color or self.HIGHLIGHT_RGB
             width = 4
         else:
-            color = QColor(DarkTheme.COLORS['border_light'])
+            r, g, b = self.NORMAL_RGB
             width = 2
         
         # Vary opacity based on weight
-        alpha = int(100 + 155 * self.edge.weight)
-        color.setAlpha(min(255, alpha))
+        alpha = min(255, int(100 + 155 * self.edge.weight))
+        alpha = min(255, round(alpha / self.ALPHA_STEP) * self.ALPHA_STEP)
         
-        self.setPen(QPen(color, width, Qt.PenStyle.SolidLine, 
-                        Qt.PenCapStyle.RoundCap))
+        key = (r, g, b, alpha, width)
+        pen = self._PEN_CACHE.get(key)
+        if pen is None:
+            pen = self._PEN_CACHE[key] = QPen(
+                QColor(r, g, b, alpha), width,
+                Qt.PenStyle.SolidLine, Qt.PenCapStyle.RoundCap
+            )
+        self.setPen(pen)
+        
+        self.style_key = None if self.edge.is_highlighted else key
+        self.canvas._place_edge_item(self)
+
+
+class _EdgeBucket(QGraphicsPathItem):
+    """
+    Single path item drawing every non-highlighted edge of one style.
+    """
+    
+    def __init__(self, key: Tuple[int, int, int, int, int], pen: QPen):
+        super().__init__()
+        self.key = key
+        self.edge_items: Dict[EdgeItem, None] = {}  # Insertion-ordered set
+        self.setPen(pen)
+        self.setZValue(0)  # Below individually drawn (highlighted) edges
+    
+    def rebuild(self):
+        """Rebuild the path from the current edge lines."""
+        path = QPainterPath()
+        for edge_item in self.edge_items:
+            line = edge_item.line()
+            path.moveTo(line.p1())
+            path.lineTo(line.p2())
+        self.setPath(path)
 
 
 class GraphCanvas(QGraphicsView):
@@ -202,11 +325,32 @@ class GraphCanvas(QGraphicsView):
     Main canvas for graph visualization with interactivity.
     """
     
+    # Node count above which only the minimal dirty region is repainted
+    LARGE_GRAPH_THRESHOLD = 500
+    
+    # View scale below which node labels are hidden
+    LABEL_MIN_SCALE = 0.4
+    
+    # Node count above which auto layout uses Barnes-Hut repulsion
+    BARNES_HUT_THRESHOLD = 200
+    
+    # Squared displacement below which a physics frame leaves a node in place
+    MIN_MOVE_SQ = 1e-4
+    
+    # Live physics timer interval (~60 steps per second)
+    PHYSICS_INTERVAL_MS = 16
+    
+    # Auto layout schedule (physics steps in total / per timer tick)
+    LAYOUT_ITERATIONS = 150
+    LAYOUT_STEPS_PER_TICK = 10
+    
     # Signals
     node_selected = pyqtSignal(int)  # node_id, -1 for deselect
     node_deleted = pyqtSignal(int)
     edge_deleted = pyqtSignal(int, int)  # source_id, target_id
     status_message = pyqtSignal(str)
+    graph_changed = pyqtSignal()  # nodes or edges added on the canvas
+    node_edited = pyqtSignal(int)  # node_id
     
     def __init__(self, graph: Graph):
         super().__init__()
@@ -218,10 +362,48 @@ class GraphCanvas(QGraphicsView):
         # Visual elements tracking
         self._node_items: Dict[int, NodeItem] = {}
         self._edge_items: List[EdgeItem] = []
+        self._edges_by_node: Dict[int, List[EdgeItem]] = defaultdict(list)
+        self._edge_index: Dict[frozenset, EdgeItem] = {}
+        
+        # Node positions as a contiguous (capacity, 2) array, rows 0..count-1
+        self._pos = np.empty((64, 2), dtype=np.float64)
+        self._vel = np.zeros((64, 2), dtype=np.float64)
+        self._pos_count = 0
+        self._nid_to_idx: Dict[int, int] = {}
+        self._idx_to_nid: List[int] = []
+        self._edge_rows: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        
+        # Edge style buckets, rebuilt lazily once per event loop pass
+        self._edge_buckets: Dict[Tuple[int, int, int, int, int], _EdgeBucket] = {}
+        self._dirty_buckets: set = set()
+        self._bucket_timer = QTimer(self)
+        self._bucket_timer.setSingleShot(True)
+        self._bucket_timer.setInterval(0)
+        self._bucket_timer.timeout.connect(self._flush_edge_buckets)
+        
+        # Edges taken out of their buckets for the current node drag
+        self._drag_edges: Dict[EdgeItem, None] = {}
+        
+        # Nodes moved since the last edge update (drags fire per pixel)
+        self._pending_edge_nodes: set = set()
+        self._edge_update_timer = QTimer(self)
+        self._edge_update_timer.setSingleShot(True)
+        self._edge_update_timer.setInterval(0)
+        self._edge_update_timer.timeout.connect(self._flush_edge_updates)
+        self.labels_visible = True
         
         # Physics (disabled by default)
         self._physics = ForceDirectedLayout()
         self._physics_enabled = False
+        self._physics_timer = QTimer(self)
+        self._physics_timer.setInterval(self.PHYSICS_INTERVAL_MS)
+        self._physics_timer.timeout.connect(self._physics_step)
+        
+        # Auto layout runs in timer ticks so painting interleaves with it
+        self._layout_timer = QTimer(self)
+        self._layout_timer.timeout.connect(self._auto_layout_step)
+        self._layout_iter = 0
+        self._layout_step_fn = None
         
         # Performance tracking
         self._frame_times: List[float] = []
@@ -231,36 +413,60 @@ class GraphCanvas(QGraphicsView):
         self._selected_node_id: Optional[int] = None
         self._edge_creation_mode = False
         self._edge_source_id: Optional[int] = None
+        self._panning = False
         
         # Setup view
         self.setRenderHint(QPainter.RenderHint.Antialiasing)
         self.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
-        self.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.FullViewportUpdate)
+        self.setOptimizationFlag(QGraphicsView.OptimizationFlag.DontSavePainterState, True)
+        self.setOptimizationFlag(QGraphicsView.OptimizationFlag.DontAdjustForAntialiasing, True)
+        self._choose_update_mode()
         self.setDragMode(QGraphicsView.DragMode.RubberBandDrag)
         self.setTransformationAnchor(QGraphicsView.ViewportAnchor.AnchorUnderMouse)
         self.setResizeAnchor(QGraphicsView.ViewportAnchor.AnchorUnderMouse)
         
         # Scene setup
         self._scene.setSceneRect(-2000, -2000, 4000, 4000)
-        self._scene.setBackgroundBrush(QBrush(QColor(DarkTheme.COLORS['background_dark'])))
         
         # Draw grid
         self._draw_grid()
     
     def _draw_grid(self):
-        """Draw background grid."""
-        grid_color = QColor(DarkTheme.COLORS['border'])
+        """Draw background grid as a tiled background brush."""
+        grid_color = QColor(DarkTheme.BORDER)
         grid_color.setAlpha(30)
-        pen = QPen(grid_color, 1)
         
+        # One grid cell is rendered once and tiled by Qt across the scene
         grid_size = 50
-        for x in range(-2000, 2000, grid_size):
-            self._scene.addLine(x, -2000, x, 2000, pen)
-        for y in range(-2000, 2000, grid_size):
-            self._scene.addLine(-2000, y, 2000, y, pen)
+        tile = QPixmap(grid_size, grid_size)
+        tile.fill(QColor(DarkTheme.BACKGROUND_DARK))
+        
+        painter = QPainter(tile)
+        painter.setPen(QPen(grid_color, 1))
+        painter.drawLine(0, 0, 0, grid_size)
+        painter.drawLine(0, 0, grid_size, 0)
+        painter.end()
+        
+        self._scene.setBackgroundBrush(QBrush(tile))
+    
+    def _choose_update_mode(self):
+        """Pick the viewport update mode based on viewport type and graph size."""
+        if self.viewport().inherits("QOpenGLWidget"):
+            mode = QGraphicsView.ViewportUpdateMode.FullViewportUpdate
+        elif self._panning:
+            # Scrolling shifts already drawn pixels; only exposed strips repaint
+            mode = QGraphicsView.ViewportUpdateMode.SmartViewportUpdate
+        elif len(self._node_items) < self.LARGE_GRAPH_THRESHOLD:
+            mode = QGraphicsView.ViewportUpdateMode.BoundingRectViewportUpdate
+        else:
+            mode = QGraphicsView.ViewportUpdateMode.MinimalViewportUpdate
+        
+        if self.viewportUpdateMode() != mode:
+            self.setViewportUpdateMode(mode)
     
     def set_graph(self, graph: Graph):
         """Set a new graph and refresh display."""
+        self._layout_timer.stop()
         self.graph = graph
         self._physics.graph = graph
         self.refresh()
@@ -271,52 +477,262 @@ class GraphCanvas(QGraphicsView):
         for item in self._node_items.values():
             self._scene.removeItem(item)
         for item in self._edge_items:
-            self._scene.removeItem(item)
+            if item.scene() is not None:
+                self._scene.removeItem(item)
+        for bucket in self._edge_buckets.values():
+            self._scene.removeItem(bucket)
         
         self._node_items.clear()
         self._edge_items.clear()
+        self._edges_by_node.clear()
+        self._edge_index.clear()
+        self._edge_buckets.clear()
+        self._pos_count = 0
+        self._nid_to_idx.clear()
+        self._idx_to_nid.clear()
+        self._edge_rows = None
+        self._dirty_buckets.clear()
+        self._drag_edges.clear()
         
         # Create edge items first (so they're behind nodes)
         for edge in self.graph.edges:
-            edge_item = EdgeItem(edge, self)
-            self._edge_items.append(edge_item)
-            self._scene.addItem(edge_item)
+            self._add_edge_item(edge)
         
         # Create node items
         for node in self.graph.nodes.values():
-            node_item = NodeItem(node, self)
-            self._node_items[node.id] = node_item
-            self._scene.addItem(node_item)
+            self._add_node_item(node)
         
         # Update physics
         self._physics.graph = self.graph
+        self._choose_update_mode()
+    
+    def add_node_item(self, node: Node) -> NodeItem:
+        """Show a node that was added to the graph."""
+        node_item = self._add_node_item(node)
+        self._choose_update_mode()
+        return node_item
+    
+    def add_nodes(self, nodes: List[Node]):
+        """Show a batch of nodes that were added to the graph."""
+        for node in nodes:
+            self._add_node_item(node)
+        self._choose_update_mode()
+    
+    def add_edge_item(self, edge) -> EdgeItem:
+        """Show an edge that was added to the graph."""
+        return self._add_edge_item(edge)
+    
+    def _add_node_item(self, node: Node) -> NodeItem:
+        """Create and add the visual item for a single node."""
+        self._add_position(node)
+        node_item = NodeItem(node, self)
+        self._node_items[node.id] = node_item
+        self._scene.addItem(node_item)
+        return node_item
+    
+    def _remove_node_item(self, node_id: int):
+        """Remove a node item together with its incident edge items."""
+        for edge_item in list(self._edges_by_node.get(node_id, ())):
+            edge = edge_item.edge
+            self._remove_edge_item(edge.source.id, edge.target.id)
+        self._edges_by_node.pop(node_id, None)
+        
+        node_item = self._node_items.pop(node_id, None)
+        if node_item is not None:
+            self._scene.removeItem(node_item)
+        self._remove_position(node_id)
+        
+        if self._selected_node_id == node_id:
+            self._selected_node_id = None
+    
+    def _add_position(self, node: Node):
+        """Append a row for a node to the position array."""
+        if self._pos_count == len(self._pos):
+            grown = np.empty((2 * len(self._pos), 2), dtype=np.float64)
+            grown[:self._pos_count] = self._pos[:self._pos_count]
+            self._pos = grown
+            grown_vel = np.zeros_like(grown)
+            grown_vel[:self._pos_count] = self._vel[:self._pos_count]
+            self._vel = grown_vel
+        
+        idx = self._pos_count
+        self._pos[idx] = (node.x, node.y)
+        self._vel[idx] = 0.0
+        self._nid_to_idx[node.id] = idx
+        self._idx_to_nid.append(node.id)
+        self._pos_count += 1
+    
+    def _remove_position(self, node_id: int):
+        """Remove a node row by moving the last row into its slot."""
+        idx = self._nid_to_idx.pop(node_id, None)
+        if idx is None:
+            return
+        
+        last = self._pos_count - 1
+        last_id = self._idx_to_nid.pop()
+        if idx != last:
+            self._pos[idx] = self._pos[last]
+            self._vel[idx] = self._vel[last]
+            self._idx_to_nid[idx] = last_id
+            self._nid_to_idx[last_id] = idx
+        self._vel[last] = 0.0
+        self._pos_count = last
+        self._edge_rows = None
+    
+    def _set_position(self, node_id: int, x: float, y: float):
+        """Record a node position in the position array."""
+        idx = self._nid_to_idx.get(node_id)
+        if idx is not None:
+            self._pos[idx, 0] = x
+            self._pos[idx, 1] = y
+    
+    def _get_edge_rows(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Get position-array rows of edge endpoints (cached until edits)."""
+        if self._edge_rows is None:
+            nid_to_idx = self._nid_to_idx
+            src = [nid_to_idx[item.edge.source.id] for item in self._edge_items]
+            dst = [nid_to_idx[item.edge.target.id] for item in self._edge_items]
+            self._edge_rows = (np.array(src, dtype=np.intp), np.array(dst, dtype=np.intp))
+        return self._edge_rows
+    
+    def _add_edge_item(self, edge) -> EdgeItem:
+        """Create and add the visual item for a single edge."""
+        edge_item = EdgeItem(edge, self)
+        self._edge_items.append(edge_item)
+        self._edges_by_node[edge.source.id].append(edge_item)
+        self._edges_by_node[edge.target.id].append(edge_item)
+        self._edge_index[frozenset((edge.source.id, edge.target.id))] = edge_item
+        self._edge_rows = None
+        return edge_item
+    
+    def _remove_edge_item(self, source_id: int, target_id: int):
+        """Remove the visual item of the edge between two nodes."""
+        edge_item = self._edge_index.pop(frozenset((source_id, target_id)), None)
+        if edge_item is None:
+            return
+        
+        self._edges_by_node[source_id].remove(edge_item)
+        self._edges_by_node[target_id].remove(edge_item)
+        self._edge_items.remove(edge_item)
+        self._drag_edges.pop(edge_item, None)
+        self._unplace_edge_item(edge_item)
+        self._edge_rows = None
+    
+    def _place_edge_item(self, edge_item: EdgeItem):
+        """Draw an edge individually or through the bucket of its style."""
+        key = None if edge_item.detached else edge_item.style_key
+        if edge_item.bucket is not None:
+            if edge_item.bucket.key == key:
+                return
+            self._unplace_edge_item(edge_item)
+        
+        if key is None:
+            if edge_item.scene() is None:
+                self._scene.addItem(edge_item)
+            return
+        
+        if edge_item.scene() is not None:
+            self._scene.removeItem(edge_item)
+        
+        bucket = self._edge_buckets.get(key)
+        if bucket is None:
+            bucket = self._edge_buckets[key] = _EdgeBucket(key, edge_item.pen())
+            self._scene.addItem(bucket)
+        bucket.edge_items[edge_item] = None
+        edge_item.bucket = bucket
+        self._mark_bucket_dirty(bucket)
+    
+    def _unplace_edge_item(self, edge_item: EdgeItem):
+        """Take an edge out of the scene or out of its bucket."""
+        bucket = edge_item.bucket
+        if bucket is not None:
+            del bucket.edge_items[edge_item]
+            edge_item.bucket = None
+            self._mark_bucket_dirty(bucket)
+        elif edge_item.scene() is not None:
+            self._scene.removeItem(edge_item)
+    
+    def _detach_drag_edges(self):
+        """Draw the edges of the selected nodes individually during a drag."""
+        # Otherwise every drag frame would rebuild whole style buckets
+        for item in self._scene.selectedItems():
+            if isinstance(item, NodeItem):
+                for edge_item in self._edges_by_node.get(item.node.id, ()):
+                    edge_item.detached = True
+                    self._place_edge_item(edge_item)
+                    self._drag_edges[edge_item] = None
+    
+    def _attach_drag_edges(self):
+        """Return the edges of dragged nodes to their style buckets."""
+        self._flush_edge_updates()
+        for edge_item in self._drag_edges:
+            edge_item.detached = False
+            self._place_edge_item(edge_item)
+        self._drag_edges.clear()
+    
+    def _mark_bucket_dirty(self, bucket: _EdgeBucket):
+        """Schedule a bucket path rebuild."""
+        self._dirty_buckets.add(bucket)
+        if not self._bucket_timer.isActive():
+            self._bucket_timer.start()
+    
+    def _flush_edge_buckets(self):
+        """Rebuild dirty bucket paths and drop empty buckets."""
+        for bucket in self._dirty_buckets:
+            if bucket.edge_items:
+                bucket.rebuild()
+            elif self._edge_buckets.get(bucket.key) is bucket:
+                del self._edge_buckets[bucket.key]
+                self._scene.removeItem(bucket)
+        self._dirty_buckets.clear()
     
     def update_edges_for_node(self, node_id: int):
         """Update edges connected to a specific node."""
-        for edge_item in self._edge_items:
-            if edge_item.edge.contains_node(node_id):
-                edge_item.update_position()
+        for edge_item in self._edges_by_node.get(node_id, ()):
+            edge_item.update_position()
+    
+    def _schedule_edge_update(self, node_id: int):
+        """Queue an edge update for a moved node."""
+        self._pending_edge_nodes.add(node_id)
+        if not self._edge_update_timer.isActive():
+            self._edge_update_timer.start()
+    
+    def _flush_edge_updates(self):
+        """Update the edges of all nodes moved since the last flush."""
+        for node_id in self._pending_edge_nodes:
+            self.update_edges_for_node(node_id)
+        self._pending_edge_nodes.clear()
     
     def _physics_step(self):
         """Perform one physics simulation step."""
         if not self._physics_enabled or not self.graph.nodes:
             return
+        if self._layout_timer.isActive():
+            return  # Auto layout drives the same arrays
         
         # Check if any node is being dragged
         dragging = any(item.isSelected() for item in self._node_items.values())
         
         if not dragging:
-            self._physics.step(self.graph)
+            # Step directly on the canvas position array
+            n = self._pos_count
+            pos = self._pos[:n]
+            prev = pos.copy()
+            src_idx, dst_idx = self._get_edge_rows()
+            self._physics.step_arrays(pos, self._vel[:n], src_idx, dst_idx)
             
-            # Update visual positions
-            for node_id, node_item in self._node_items.items():
-                node = self.graph.nodes.get(node_id)
-                if node:
-                    node_item.setPos(node.x, node.y)
+            # Only nodes that moved noticeably are touched; smaller moves
+            # are discarded so the array stays in sync with the items
+            delta = pos - prev
+            moved = (delta * delta).sum(axis=1) > self.MIN_MOVE_SQ
+            pos[~moved] = prev[~moved]
             
-            # Update edges
-            for edge_item in self._edge_items:
-                edge_item.update_position()
+            # Batch position updates without per-item scene notifications
+            self._scene.blockSignals(True)
+            try:
+                self._apply_array_positions(np.nonzero(moved)[0])
+            finally:
+                self._scene.blockSignals(False)
         
         # Track FPS
         current_time = time.time()
@@ -327,6 +743,43 @@ class GraphCanvas(QGraphicsView):
         if len(self._frame_times) > 60:
             self._frame_times.pop(0)
     
+    def _apply_array_positions(self, rows: np.ndarray):
+        """Write the given position array rows back to nodes and items."""
+        nodes = self.graph.nodes
+        node_items = self._node_items
+        idx_to_nid = self._idx_to_nid
+        moved_edges = {}
+        
+        for idx, (x, y), (vx, vy) in zip(rows.tolist(), self._pos[rows].tolist(),
+                                         self._vel[rows].tolist()):
+            nid = idx_to_nid[idx]
+            node = nodes[nid]
+            node.x, node.y = x, y
+            node.vx, node.vy = vx, vy
+            node_items[nid].setPos(x, y)
+            moved_edges.update(dict.fromkeys(self._edges_by_node.get(nid, ())))
+        
+        for edge_item in moved_edges:
+            edge_item.update_position()
+        
+        # All edges are current; drop the updates queued by setPos above
+        self._pending_edge_nodes.clear()
+    
+    def _sync_item_positions(self):
+        """Move node and edge items to the current node coordinates."""
+        # Update visual positions
+        for node_id, node_item in self._node_items.items():
+            node = self.graph.nodes.get(node_id)
+            if node:
+                node_item.setPos(node.x, node.y)
+        
+        # Update edges
+        for edge_item in self._edge_items:
+            edge_item.update_position()
+        
+        # All edges are current; drop the updates queued by setPos above
+        self._pending_edge_nodes.clear()
+    
     def get_fps(self) -> float:
         """Get current FPS."""
         if not self._frame_times:
@@ -337,6 +790,16 @@ class GraphCanvas(QGraphicsView):
     def toggle_physics(self, enabled: bool):
         """Toggle physics simulation."""
         self._physics_enabled = enabled
+        
+        # Every item moves each frame, so BSP re-indexing is pure overhead
+        if enabled:
+            self._scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.NoIndex)
+            self._last_frame_time = time.time()
+            self._physics_timer.start()
+        else:
+            self._physics_timer.stop()
+            self._scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.BspTreeIndex)
+        self._choose_update_mode()
     
     def update_physics_params(self, repulsion: float, attraction: float, damping: float):
         """Update physics parameters."""
@@ -347,18 +810,29 @@ class GraphCanvas(QGraphicsView):
     def zoom(self, factor: float):
         """Zoom the view."""
         self.scale(factor, factor)
+        self._update_label_visibility()
     
     def fit_in_view(self):
         """Fit all content in view."""
-        if self.graph.nodes:
+        if self._pos_count:
             # Calculate bounding rect of all nodes
-            min_x = min(n.x for n in self.graph.nodes.values()) - 100
-            max_x = max(n.x for n in self.graph.nodes.values()) + 100
-            min_y = min(n.y for n in self.graph.nodes.values()) - 100
-            max_y = max(n.y for n in self.graph.nodes.values()) + 100
+            pos = self._pos[:self._pos_count]
+            min_x, min_y = (pos.min(axis=0) - 100).tolist()
+            max_x, max_y = (pos.max(axis=0) + 100).tolist()
             
             rect = QRectF(min_x, min_y, max_x - min_x, max_y - min_y)
             self.fitInView(rect, Qt.AspectRatioMode.KeepAspectRatio)
+            self._update_label_visibility()
+    
+    def _update_label_visibility(self):
+        """Hide node labels when zoomed out too far to read them."""
+        visible = self.transform().m11() >= self.LABEL_MIN_SCALE
+        if visible == self.labels_visible:
+            return
+        
+        self.labels_visible = visible
+        for node_item in self._node_items.values():
+            node_item.set_label_visible(visible)
     
     def clear_selection(self):
         """Clear all selections."""
@@ -393,11 +867,10 @@ class GraphCanvas(QGraphicsView):
     def highlight_edges(self, edges: List[Tuple[int, int]], color: Tuple[int, int, int] = None):
         """Highlight specific edges."""
         for source_id, target_id in edges:
-            for edge_item in self._edge_items:
-                if ((edge_item.edge.source.id == source_id and edge_item.edge.target.id == target_id) or
-                    (edge_item.edge.source.id == target_id and edge_item.edge.target.id == source_id)):
-                    edge_item.edge.set_highlight(True, color)
-                    edge_item.update_appearance()
+            edge_item = self._edge_index.get(frozenset((source_id, target_id)))
+            if edge_item is not None:
+                edge_item.edge.set_highlight(True, color)
+                edge_item.update_appearance()
     
     def highlight_path(self, path: List[int], color: Tuple[int, int, int] = None):
         """Highlight a path (nodes and edges)."""
@@ -424,12 +897,15 @@ class GraphCanvas(QGraphicsView):
             return
         
         max_cent = max(centrality.values())
+        
+        # Compute degrees once instead of per node
+        degrees = {nid: self.graph.get_degree(nid) for nid in self.graph.nodes}
+        max_degree = max(degrees.values(), default=0)
+        
         for node_id, cent in centrality.items():
             if node_id in self._node_items:
                 # Map centrality to degree for sizing
-                degree = self.graph.get_degree(node_id)
-                max_degree = max(self.graph.get_degree(nid) for nid in self.graph.nodes)
-                self._node_items[node_id].set_size_by_degree(degree, max_degree)
+                self._node_items[node_id].set_size_by_degree(degrees[node_id], max_degree)
     
     def show_node_tooltip(self, node: Node):
         """Show tooltip for a node."""
@@ -454,19 +930,21 @@ class GraphCanvas(QGraphicsView):
             self.graph.update_node(node.id, **updated_data)
             if node.id in self._node_items:
                 self._node_items[node.id].update_appearance()
+            self.node_edited.emit(node.id)
             self.status_message.emit(f"Düğüm güncellendi: {node.name}")
     
     def delete_node(self, node_id: int):
         """Delete a node."""
         if node_id in self.graph.nodes:
             self.graph.remove_node(node_id)
-            self.refresh()
+            self._remove_node_item(node_id)
+            self._choose_update_mode()
             self.node_deleted.emit(node_id)
     
     def delete_edge(self, source_id: int, target_id: int):
         """Delete an edge."""
         if self.graph.remove_edge(source_id, target_id):
-            self.refresh()
+            self._remove_edge_item(source_id, target_id)
             self.edge_deleted.emit(source_id, target_id)
     
     def start_edge_creation(self, source_id: int):
@@ -507,7 +985,8 @@ class GraphCanvas(QGraphicsView):
                     if target_id != self._edge_source_id:
                         edge = self.graph.add_edge(self._edge_source_id, target_id)
                         if edge:
-                            self.refresh()
+                            self._add_edge_item(edge)
+                            self.graph_changed.emit()
                             self.status_message.emit(
                                 f"Bağlantı oluşturuldu: {self._edge_source_id} - {target_id}"
                             )
@@ -527,13 +1006,24 @@ class GraphCanvas(QGraphicsView):
         
         elif event.button() == Qt.MouseButton.MiddleButton:
             self.setDragMode(QGraphicsView.DragMode.ScrollHandDrag)
+            self._panning = True
+            self._choose_update_mode()
         
         super().mousePressEvent(event)
+        
+        # Selection is final once the scene has handled the press
+        if event.button() == Qt.MouseButton.LeftButton and isinstance(
+                self.itemAt(event.pos()), NodeItem):
+            self._detach_drag_edges()
     
     def mouseReleaseEvent(self, event: QMouseEvent):
         """Handle mouse release."""
-        if event.button() == Qt.MouseButton.MiddleButton:
+        if event.button() == Qt.MouseButton.LeftButton and self._drag_edges:
+            self._attach_drag_edges()
+        elif event.button() == Qt.MouseButton.MiddleButton:
             self.setDragMode(QGraphicsView.DragMode.RubberBandDrag)
+            self._panning = False
+            self._choose_update_mode()
         super().mouseReleaseEvent(event)
     
     def contextMenuEvent(self, event: QContextMenuEvent):
@@ -584,32 +1074,34 @@ class GraphCanvas(QGraphicsView):
     def _add_node_at_position(self, x: float, y: float):
         """Add a new node at the given position."""
         node = self.graph.add_node(x=x, y=y)
-        self.refresh()
+        self.add_node_item(node)
+        self.graph_changed.emit()
         self.status_message.emit(f"Düğüm eklendi: {node.name}")
     
     def auto_layout(self):
         """
         Automatically arrange nodes using physics engine simulation.
-        Runs physics for a duration then stops.
+        Runs physics for a fixed number of timer-driven steps then stops.
         """
         if not self.graph.nodes:
             return
         
-        import random
+        self._layout_timer.stop()
         
         nodes = list(self.graph.nodes.values())
         n = len(nodes)
         
-        # Initialize positions in a circle to start
+        # Initialize positions in a circle to start (vectorized)
         center_x, center_y = 400, 300
         initial_radius = min(350, 80 + n * 15)
         
-        for i, node in enumerate(nodes):
-            angle = 2 * math.pi * i / n
-            node.x = center_x + initial_radius * math.cos(angle) + random.uniform(-20, 20)
-            node.y = center_y + initial_radius * math.sin(angle) + random.uniform(-20, 20)
-            node.vx = 0
-            node.vy = 0
+        positions = circle_init(n, center_x, center_y, initial_radius, 20)
+        
+        for node, (x, y) in zip(nodes, positions.tolist()):
+            node.x, node.y = x, y
+            node.vx, node.vy = 0.0, 0.0
+            self._set_position(node.id, x, y)
+        self._vel[:self._pos_count] = 0.0
         
         # Reset and configure physics engine - increased repulsion for more spacing
         self._physics.repulsion = 15000.0
@@ -619,30 +1111,53 @@ class GraphCanvas(QGraphicsView):
         self._physics.temperature = 1.0
         self._physics.graph = self.graph
         
-        # Run physics simulation for fixed iterations
-        iterations = 150
+        # Approximate repulsion on larger graphs (O(n log n) instead of O(n^2));
+        # smaller graphs run the vectorized kernel on the position array
+        if n > self.BARNES_HUT_THRESHOLD:
+            self._layout_step_fn = self._physics.step_bh
+        else:
+            self._layout_step_fn = None
         
-        for i in range(iterations):
-            self._physics.step(self.graph)
-            
-            # Update visual positions every 10 iterations for performance
-            if i % 10 == 0:
-                for node_id, node_item in self._node_items.items():
-                    node = self.graph.nodes.get(node_id)
-                    if node:
-                        node_item.setPos(node.x, node.y)
-                for edge_item in self._edge_items:
-                    edge_item.update_position()
-                # Process events to keep UI responsive
-                from PyQt6.QtWidgets import QApplication
-                QApplication.processEvents()
+        # Skip item re-indexing while positions churn; rebuilt once afterwards
+        self._scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.NoIndex)
+        
+        self._layout_iter = 0
+        self._layout_timer.start(0)
+    
+    def _auto_layout_step(self):
+        """Advance the auto layout by one timer tick."""
+        steps = min(self.LAYOUT_STEPS_PER_TICK, self.LAYOUT_ITERATIONS - self._layout_iter)
+        
+        if self._layout_step_fn is None:
+            n = self._pos_count
+            pos, vel = self._pos[:n], self._vel[:n]
+            src_idx, dst_idx = self._get_edge_rows()
+            for _ in range(steps):
+                self._physics.step_arrays(pos, vel, src_idx, dst_idx)
+            self._apply_array_positions(np.arange(n))
+        else:
+            for _ in range(steps):
+                self._layout_step_fn(self.graph)
+            self._sync_item_positions()
+        
+        self._layout_iter += steps
+        
+        if self._layout_iter >= self.LAYOUT_ITERATIONS:
+            self._finish_auto_layout()
+    
+    def _finish_auto_layout(self):
+        """Stop the auto layout and settle the final positions."""
+        self._layout_timer.stop()
+        self._layout_step_fn = None
+        
+        if not self._physics_enabled:
+            self._scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.BspTreeIndex)
         
         # Reset velocities
-        for node in nodes:
+        for node in self.graph.nodes.values():
             node.vx = 0
             node.vy = 0
         
-        self.refresh()
         self.fit_in_view()
         self.status_message.emit("Düğümler fizik motoruyla düzenlendi")
     
@@ -0,0 +1,48 @@
+"""
+Background worker for JSON graph import/export.
+"""
+from typing import Any, Dict, Optional
+
+from PyQt6.QtCore import QObject, pyqtSignal
+
+from ..utils.data_handler import dumps_json, import_json
+
+
+class JsonIoWorker(QObject):
+    """
+    Reads or writes a graph JSON file off the GUI thread.
+    
+    The worker is moved to a QThread and its run() slot connected to the
+    thread's started signal. Results are delivered through signals, so
+    the receiving slots run back on the GUI thread.
+    """
+    
+    # Signals
+    loaded = pyqtSignal(object, str)  # Graph, filename
+    saved = pyqtSignal(str)  # filename
+    failed = pyqtSignal(str)  # error message
+    finished = pyqtSignal()
+    
+    def __init__(self, filename: str, data: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            filename: File to read, or to write when data is given
+            data: Serialized graph to write; None to load instead
+        """
+        super().__init__()
+        self.filename = filename
+        self.data = data
+    
+    def run(self):
+        """Perform the load or save and report the result."""
+        try:
+            if self.data is None:
+                self.loaded.emit(import_json(self.filename), self.filename)
+            else:
+                with open(self.filename, 'wb') as f:
+                    f.write(dumps_json(self.data))
+                self.saved.emit(self.filename)
+        except Exception as e:
+            self.failed.emit(str(e))
+        finally:
+            self.finished.emit()
@@ -4,18 +4,22 @@ Main application window for Social Network Analyzer.
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QSplitter, QMenuBar, QMenu, QStatusBar, QLabel,
-    QFileDialog, QMessageBox
+    QFileDialog, QMessageBox, QPushButton
 )
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import Qt, QTimer, QThread, QSignalBlocker
 from PyQt6.QtGui import QAction, QIcon
-import json
+import io
 import os
 
+import numpy as np
+from typing import Optional
+
 from .styles import DarkTheme
 from .graph_canvas import GraphCanvas
 from .control_panel import ControlPanel
 from .stats_panel import StatsPanel
 from .algorithm_panel import AlgorithmPanel
+from .json_io_worker import JsonIoWorker
 from ..models.graph import Graph
 
 
@@ -24,6 +28,18 @@ class MainWindow(QMainWindow):
     Main application window containing all UI components.
     """
     
+    # Minimum time between statistics recomputations (ms)
+    STATS_UPDATE_INTERVAL = 500
+    
+    # Delay for coalescing selection bursts into one UI update (ms, ~1 frame)
+    SELECTION_UPDATE_INTERVAL = 16
+    
+    # Delay for coalescing bursts of algorithm results into one status update (ms)
+    RESULT_UPDATE_INTERVAL = 50
+    
+    # Matrix rows written per event loop tick during export
+    EXPORT_CHUNK_ROWS = 256
+    
     def __init__(self):
         super().__init__()
         
@@ -41,10 +57,31 @@ class MainWindow(QMainWindow):
         self._init_status_bar()
         self._init_connections()
         
-        # Start stats update timer
-        self._stats_timer = QTimer(self)
-        self._stats_timer.timeout.connect(self._update_stats)
-        self._stats_timer.start(500)  # Update every 500ms
+        # Stats are recomputed on change, coalesced to at most once per interval
+        self._stats_dirty = False
+        self._stats_pending = False
+        
+        # Latest canvas selection, applied to the panels once per frame
+        self._pending_sel: Optional[int] = None
+        self._last_selected_id: Optional[int] = None
+        self._sel_timer = QTimer(self)
+        self._sel_timer.setSingleShot(True)
+        self._sel_timer.setInterval(self.SELECTION_UPDATE_INTERVAL)
+        self._sel_timer.timeout.connect(self._flush_selection)
+        
+        # Latest algorithm result, shown once a burst of runs settles
+        self._pending_result = None
+        self._result_timer = QTimer(self)
+        self._result_timer.setSingleShot(True)
+        self._result_timer.setInterval(self.RESULT_UPDATE_INTERVAL)
+        self._result_timer.timeout.connect(self._flush_result)
+        
+        # Background JSON import/export (one operation at a time)
+        self._io_thread: Optional[QThread] = None
+        self._io_worker: Optional[JsonIoWorker] = None
+        
+        # Running chunked matrix export: (file, filename, rows, row format, next row)
+        self._matrix_export = None
     
     def _init_ui(self):
         """Initialize the main UI layout."""
@@ -82,23 +119,56 @@ class MainWindow(QMainWindow):
         main_layout.addWidget(self.stats_panel)
     
     def _init_menu(self):
-        """Initialize the menu bar."""
-        menubar = self.menuBar()
-        
-        # File Menu
-        file_menu = menubar.addMenu("Dosya")
+        """
+        Initialize the menu bar.
         
-        new_action = QAction("Yeni Graf", self)
-        new_action.setShortcut("Ctrl+N")
-        new_action.triggered.connect(self._new_graph)
-        file_menu.addAction(new_action)
+        Menus are populated on first open. Actions with keyboard shortcuts
+        are created up front and registered on the window so the shortcuts
+        work before their menu has ever been shown.
+        """
+        menubar = self.menuBar()
+        self._built_menus = set()
+        
+        self._new_action = self._shortcut_action("Yeni Graf", "Ctrl+N", self._new_graph)
+        self._import_json_action = self._shortcut_action("JSON İçe Aktar...", "Ctrl+O", self._import_json)
+        self._export_json_action = self._shortcut_action("JSON Dışa Aktar...", "Ctrl+S", self._export_json)
+        self._exit_action = self._shortcut_action("Çıkış", "Ctrl+Q", self.close)
+        self._clear_action = self._shortcut_action("Seçimleri Temizle", "Escape", self._clear_selections)
+        self._fit_action = self._shortcut_action("Sığdır", "Ctrl+0", self.graph_canvas.fit_in_view)
+        self._zoom_in_action = self._shortcut_action(
+            "Yakınlaştır", "Ctrl++", lambda: self.graph_canvas.zoom(1.2))
+        self._zoom_out_action = self._shortcut_action(
+            "Uzaklaştır", "Ctrl+-", lambda: self.graph_canvas.zoom(0.8))
+        
+        for title, populate in (("Dosya", self._populate_file_menu),
+                                ("Düzenle", self._populate_edit_menu),
+                                ("Görünüm", self._populate_view_menu),
+                                ("Yardım", self._populate_help_menu)):
+            menu = menubar.addMenu(title)
+            menu.aboutToShow.connect(lambda m=menu, f=populate: self._populate_menu(m, f))
+    
+    def _shortcut_action(self, text: str, shortcut: str, slot) -> QAction:
+        """Create an action whose shortcut is active on the whole window."""
+        action = QAction(text, self)
+        action.setShortcut(shortcut)
+        action.triggered.connect(slot)
+        self.addAction(action)
+        return action
+    
+    def _populate_menu(self, menu, populate):
+        """Fill a menu the first time it is shown."""
+        if menu in self._built_menus:
+            return
+        self._built_menus.add(menu)
+        populate(menu)
+    
+    def _populate_file_menu(self, file_menu):
+        """Build the File menu actions."""
+        file_menu.addAction(self._new_action)
         
         file_menu.addSeparator()
         
-        import_json_action = QAction("JSON İçe Aktar...", self)
-        import_json_action.setShortcut("Ctrl+O")
-        import_json_action.triggered.connect(self._import_json)
-        file_menu.addAction(import_json_action)
+        file_menu.addAction(self._import_json_action)
         
         import_csv_action = QAction("CSV İçe Aktar...", self)
         import_csv_action.triggered.connect(self._import_csv)
@@ -106,10 +176,7 @@ class MainWindow(QMainWindow):
         
         file_menu.addSeparator()
         
-        export_json_action = QAction("JSON Dışa Aktar...", self)
-        export_json_action.setShortcut("Ctrl+S")
-        export_json_action.triggered.connect(self._export_json)
-        file_menu.addAction(export_json_action)
+        file_menu.addAction(self._export_json_action)
         
         export_csv_action = QAction("CSV Dışa Aktar...", self)
         export_csv_action.triggered.connect(self._export_csv)
@@ -125,44 +192,24 @@ class MainWindow(QMainWindow):
         
         file_menu.addSeparator()
         
-        exit_action = QAction("Çıkış", self)
-        exit_action.setShortcut("Ctrl+Q")
-        exit_action.triggered.connect(self.close)
-        file_menu.addAction(exit_action)
-        
-        # Edit Menu
-        edit_menu = menubar.addMenu("Düzenle")
-        
-        clear_action = QAction("Seçimleri Temizle", self)
-        clear_action.setShortcut("Escape")
-        clear_action.triggered.connect(self._clear_selections)
-        edit_menu.addAction(clear_action)
+        file_menu.addAction(self._exit_action)
+    
+    def _populate_edit_menu(self, edit_menu):
+        """Build the Edit menu actions."""
+        edit_menu.addAction(self._clear_action)
         
         clear_highlights_action = QAction("Vurguları Temizle", self)
         clear_highlights_action.triggered.connect(self._clear_highlights)
         edit_menu.addAction(clear_highlights_action)
-        
-        # View Menu
-        view_menu = menubar.addMenu("Görünüm")
-        
-        fit_action = QAction("Sığdır", self)
-        fit_action.setShortcut("Ctrl+0")
-        fit_action.triggered.connect(self.graph_canvas.fit_in_view)
-        view_menu.addAction(fit_action)
-        
-        zoom_in_action = QAction("Yakınlaştır", self)
-        zoom_in_action.setShortcut("Ctrl++")
-        zoom_in_action.triggered.connect(lambda: self.graph_canvas.zoom(1.2))
-        view_menu.addAction(zoom_in_action)
-        
-        zoom_out_action = QAction("Uzaklaştır", self)
-        zoom_out_action.setShortcut("Ctrl+-")
-        zoom_out_action.triggered.connect(lambda: self.graph_canvas.zoom(0.8))
-        view_menu.addAction(zoom_out_action)
-        
-        # Help Menu
-        help_menu = menubar.addMenu("Yardım")
-        
+    
+    def _populate_view_menu(self, view_menu):
+        """Build the View menu actions."""
+        view_menu.addAction(self._fit_action)
+        view_menu.addAction(self._zoom_in_action)
+        view_menu.addAction(self._zoom_out_action)
+    
+    def _populate_help_menu(self, help_menu):
+        """Build the Help menu actions."""
         about_action = QAction("Hakkında", self)
         about_action.triggered.connect(self._show_about)
         help_menu.addAction(about_action)
@@ -175,6 +222,11 @@ class MainWindow(QMainWindow):
         self.status_label = QLabel("Hazır")
         self.status_bar.addWidget(self.status_label)
         
+        self.cancel_export_btn = QPushButton("İptal")
+        self.cancel_export_btn.clicked.connect(self._cancel_matrix_export)
+        self.cancel_export_btn.hide()
+        self.status_bar.addPermanentWidget(self.cancel_export_btn)
+        
         self.node_status = QLabel("Düğüm: -")
         self.status_bar.addPermanentWidget(self.node_status)
     
@@ -184,12 +236,16 @@ class MainWindow(QMainWindow):
         self.control_panel.node_added.connect(self._on_node_added)
         self.control_panel.edge_added.connect(self._on_edge_added)
         self.control_panel.auto_layout_requested.connect(self.graph_canvas.auto_layout)
+        self.control_panel.physics_toggled.connect(self.graph_canvas.toggle_physics)
         
         # Canvas connections
         self.graph_canvas.node_selected.connect(self._on_node_selected)
         self.graph_canvas.node_deleted.connect(self._on_node_deleted)
         self.graph_canvas.edge_deleted.connect(self._on_edge_deleted)
         self.graph_canvas.status_message.connect(self._show_status)
+        self.graph_canvas.graph_changed.connect(self._schedule_stats)
+        self.graph_canvas.graph_changed.connect(self._refresh_selection)
+        self.graph_canvas.node_edited.connect(self._on_node_edited)
         
         # Algorithm panel connections
         self.algorithm_panel.algorithm_completed.connect(self._on_algorithm_completed)
@@ -197,18 +253,33 @@ class MainWindow(QMainWindow):
     
     def _on_node_added(self, node):
         """Handle node addition from control panel."""
-        self.graph_canvas.refresh()
-        self._update_stats()
+        self.graph_canvas.add_node_item(node)
+        self._schedule_stats()
         self._show_status(f"Düğüm eklendi: {node.name}")
     
     def _on_edge_added(self, edge):
         """Handle edge addition from control panel."""
-        self.graph_canvas.refresh()
-        self._update_stats()
+        self.graph_canvas.add_edge_item(edge)
+        self._refresh_selection()
+        self._schedule_stats()
         self._show_status(f"Bağlantı eklendi: {edge.source.name} - {edge.target.name}")
     
     def _on_node_selected(self, node_id):
-        """Handle node selection on canvas."""
+        """Handle node selection on canvas (coalesced per frame)."""
+        if self._pending_sel is None and node_id == self._last_selected_id:
+            return
+        self._pending_sel = node_id
+        if not self._sel_timer.isActive():
+            self._sel_timer.start()
+    
+    def _flush_selection(self):
+        """Show the most recent selection in the status bar and control panel."""
+        node_id = self._pending_sel
+        self._pending_sel = None
+        if node_id is None or node_id == self._last_selected_id:
+            return
+        self._last_selected_id = node_id
+        
         if node_id >= 0:
             node = self.graph.nodes.get(node_id)
             if node:
@@ -218,39 +289,83 @@ class MainWindow(QMainWindow):
             self.node_status.setText("Düğüm: -")
             self.control_panel.set_selected_node(None)
     
+    def _refresh_selection(self):
+        """Show the selected node again after its details may have changed."""
+        node_id = self._last_selected_id
+        self._last_selected_id = None
+        if node_id is not None:
+            self._on_node_selected(node_id)
+    
+    def _on_node_edited(self, node_id):
+        """Handle node property edits made on the canvas."""
+        self._refresh_selection()
+        self._schedule_stats()
+    
     def _on_node_deleted(self, node_id):
         """Handle node deletion."""
-        self._update_stats()
+        self._last_selected_id = None
+        self._schedule_stats()
         self._show_status(f"Düğüm silindi: ID {node_id}")
     
     def _on_edge_deleted(self, source_id, target_id):
         """Handle edge deletion."""
-        self._update_stats()
+        self._refresh_selection()
+        self._schedule_stats()
         self._show_status(f"Bağlantı silindi: {source_id} - {target_id}")
     
     def _on_algorithm_completed(self, result):
-        """Handle algorithm completion."""
-        self._show_status(f"{result.name}: {result.message}")
+        """Handle algorithm completion (coalesced; the last result wins)."""
+        self._pending_result = result
+        if not self._result_timer.isActive():
+            self._result_timer.start()
+    
+    def _flush_result(self):
+        """Show the most recent algorithm result in the status bar."""
+        result = self._pending_result
+        self._pending_result = None
+        if result is not None:
+            self._show_status(f"{result.name}: {result.message}")
     
     def _update_stats(self):
         """Update statistics panel."""
+        self._stats_dirty = False
         self.stats_panel.update_stats()
     
+    def _schedule_stats(self):
+        """Mark statistics stale and schedule a coalesced update."""
+        self._stats_dirty = True
+        if not self._stats_pending:
+            self._stats_pending = True
+            QTimer.singleShot(self.STATS_UPDATE_INTERVAL, self._flush_stats)
+    
+    def _flush_stats(self):
+        """Update statistics if they changed since the last update."""
+        self._stats_pending = False
+        if self._stats_dirty:
+            self._update_stats()
+    
     def _show_status(self, message):
         """Show message in status bar."""
         self.status_label.setText(message)
     
     def _new_graph(self):
         """Create a new empty graph."""
-        reply = QMessageBox.question(
-            self, "Yeni Graf",
-            "Mevcut graf silinecek. Devam etmek istiyor musunuz?",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
-        )
+        # Nothing to lose on an empty graph, so don't ask
+        if self.graph.nodes:
+            reply = QMessageBox.question(
+                self, "Yeni Graf",
+                "Mevcut graf silinecek. Devam etmek istiyor musunuz?",
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+                QMessageBox.StandardButton.Yes
+            )
+        else:
+            reply = QMessageBox.StandardButton.Yes
         
         if reply == QMessageBox.StandardButton.Yes:
             self.graph.clear()
             self.graph_canvas.refresh()
+            self._last_selected_id = None
+            self._on_node_selected(-1)
             self._update_stats()
             self._show_status("Yeni graf oluşturuldu")
     
@@ -261,20 +376,78 @@ class MainWindow(QMainWindow):
         )
         
         if filename:
-            try:
-                with open(filename, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                
-                self.graph = Graph.from_dict(data)
-                self.graph_canvas.set_graph(self.graph)
-                self.control_panel.graph = self.graph
-                self.stats_panel.graph = self.graph
-                self.algorithm_panel.graph = self.graph
-                
-                self._update_stats()
-                self._show_status(f"Graf yüklendi: {filename}")
-            except Exception as e:
-                QMessageBox.critical(self, "Hata", f"Dosya yüklenemedi:\n{str(e)}")
+            worker = JsonIoWorker(filename)
+            worker.loaded.connect(self._apply_loaded_graph)
+            self._start_json_io(worker, f"Graf yükleniyor: {filename}")
+    
+    def _apply_loaded_graph(self, graph: Graph, filename: str):
+        """Show a graph loaded by the background worker."""
+        self._load_graph(graph)
+        self._show_status(f"Graf yüklendi: {filename}")
+    
+    def _load_graph(self, graph: Graph):
+        """Move a freshly loaded graph into the shared graph and redraw."""
+        self.graph.load_from_graph(graph)
+        
+        # Rebuild the views silently, then publish one consistent state
+        blockers = [QSignalBlocker(w) for w in (self.graph_canvas, self.control_panel)]
+        self.graph_canvas.set_graph(self.graph)
+        for blocker in blockers:
+            blocker.unblock()
+        
+        self._pending_sel = None
+        self._last_selected_id = None
+        self.node_status.setText("Düğüm: -")
+        self.control_panel.set_selected_node(None)
+        self._update_stats()
+    
+    def _start_json_io(self, worker: JsonIoWorker, message: str):
+        """Run a JSON worker on a background thread."""
+        if self._io_thread is not None:
+            self._show_status("Önceki dosya işlemi sürüyor")
+            return
+        
+        thread = QThread(self)
+        worker.moveToThread(thread)
+        worker.saved.connect(self._on_json_saved)
+        worker.failed.connect(self._on_json_io_failed)
+        thread.started.connect(worker.run)
+        worker.finished.connect(thread.quit)
+        thread.finished.connect(worker.deleteLater)
+        thread.finished.connect(thread.deleteLater)
+        thread.finished.connect(self._on_json_io_finished)
+        
+        self._io_thread = thread
+        self._io_worker = worker
+        self._show_status(message)
+        thread.start()
+    
+    def _wait_json_io(self):
+        """Block until a running JSON worker thread has finished."""
+        if self._io_thread is None:
+            return
+        
+        # run() is one blocking call, so quit() only takes effect after it
+        # returns; a thread destroyed while running would abort the app
+        self._io_thread.quit()
+        self._io_thread.wait()
+    
+    def _on_json_saved(self, filename: str):
+        """Report a finished background export."""
+        self._show_status(f"Graf kaydedildi: {filename}")
+    
+    def _on_json_io_failed(self, message: str):
+        """Report a failed background import/export."""
+        if self._io_worker is not None and self._io_worker.data is not None:
+            QMessageBox.critical(self, "Hata", f"Dosya kaydedilemedi:\n{message}")
+        else:
+            QMessageBox.critical(self, "Hata", f"Dosya yüklenemedi:\n{message}")
+        self._show_status("Hazır")
+    
+    def _on_json_io_finished(self):
+        """Release the finished JSON worker thread."""
+        self._io_thread = None
+        self._io_worker = None
     
     def _import_csv(self):
         """Import graph from CSV file."""
@@ -284,14 +457,8 @@ class MainWindow(QMainWindow):
         
         if filename:
             try:
-                from ..utils.data_handler import DataHandler
-                self.graph = DataHandler.import_csv(filename)
-                self.graph_canvas.set_graph(self.graph)
-                self.control_panel.graph = self.graph
-                self.stats_panel.graph = self.graph
-                self.algorithm_panel.graph = self.graph
-                
-                self._update_stats()
+                from ..utils.data_handler import import_csv
+                self._load_graph(import_csv(filename))
                 self._show_status(f"Graf yüklendi: {filename}")
             except Exception as e:
                 QMessageBox.critical(self, "Hata", f"Dosya yüklenemedi:\n{str(e)}")
@@ -303,13 +470,9 @@ class MainWindow(QMainWindow):
         )
         
         if filename:
-            try:
-                data = self.graph.to_dict()
-                with open(filename, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, indent=2, ensure_ascii=False)
-                self._show_status(f"Graf kaydedildi: {filename}")
-            except Exception as e:
-                QMessageBox.critical(self, "Hata", f"Dosya kaydedilemedi:\n{str(e)}")
+            # Snapshot on the GUI thread; serialize and write in the background
+            worker = JsonIoWorker(filename, self.graph.to_dict())
+            self._start_json_io(worker, f"Graf kaydediliyor: {filename}")
     
     def _export_csv(self):
         """Export graph to CSV file."""
@@ -319,8 +482,8 @@ class MainWindow(QMainWindow):
         
         if filename:
             try:
-                from ..utils.data_handler import DataHandler
-                DataHandler.export_csv(self.graph, filename)
+                from ..utils.data_handler import export_csv
+                export_csv(self.graph, filename)
                 self._show_status(f"Graf kaydedildi: {filename}")
             except Exception as e:
                 QMessageBox.critical(self, "Hata", f"Dosya kaydedilemedi:\n{str(e)}")
@@ -333,44 +496,117 @@ class MainWindow(QMainWindow):
         
         if filename:
             try:
-                adj_list = self.graph.get_adjacency_list()
-                with open(filename, 'w', encoding='utf-8') as f:
-                    f.write("# Komşuluk Listesi\n")
-                    f.write("# Format: DüğümID: [Komşu1, Komşu2, ...]\n\n")
-                    for node_id, neighbors in sorted(adj_list.items()):
-                        node_name = self.graph.nodes[node_id].name
-                        neighbor_names = [self.graph.nodes[n].name for n in neighbors]
-                        f.write(f"{node_id} ({node_name}): {neighbors}\n")
-                        f.write(f"  İsimler: {neighbor_names}\n")
+                adjacency = self.graph.adjacency_view()
+                name_of = {nid: node.name for nid, node in self.graph.nodes.items()}
+                
+                # Build the whole text in memory and write it once
+                buf = io.StringIO()
+                buf.write("# Komşuluk Listesi\n")
+                buf.write("# Format: DüğümID: [Komşu1, Komşu2, ...]\n\n")
+                for node_id in sorted(adjacency):
+                    neighbors = adjacency[node_id]
+                    neighbor_names = [name_of[n] for n in neighbors]
+                    buf.write(f"{node_id} ({name_of[node_id]}): {list(neighbors)}\n")
+                    buf.write(f"  İsimler: {neighbor_names}\n")
+                
+                from ..utils.data_handler import write_text
+                write_text(filename, buf.getvalue())
                 self._show_status(f"Komşuluk listesi kaydedildi: {filename}")
             except Exception as e:
                 QMessageBox.critical(self, "Hata", f"Dosya kaydedilemedi:\n{str(e)}")
     
     def _export_adjacency_matrix(self):
-        """Export adjacency matrix to file."""
+        """Export adjacency matrix to file, a chunk of rows per event loop tick."""
         filename, _ = QFileDialog.getSaveFileName(
             self, "Komşuluk Matrisi Kaydet", "adjacency_matrix.txt", "Text Files (*.txt)"
         )
         
         if filename:
+            if self._matrix_export is not None:
+                self._show_status("Önceki dosya işlemi sürüyor")
+                return
+            
+            f = None
             try:
                 matrix, node_ids = self.graph.get_adjacency_matrix()
-                with open(filename, 'w', encoding='utf-8') as f:
-                    f.write("# Komşuluk Matrisi\n")
-                    f.write(f"# Düğüm sırası: {node_ids}\n\n")
-                    
-                    # Header
-                    f.write("     " + " ".join(f"{nid:5}" for nid in node_ids) + "\n")
-                    f.write("-" * (6 + 6 * len(node_ids)) + "\n")
-                    
-                    # Matrix rows
-                    for i, row in enumerate(matrix):
-                        f.write(f"{node_ids[i]:4}|")
-                        f.write(" ".join(f"{val:5.2f}" for val in row) + "\n")
                 
-                self._show_status(f"Komşuluk matrisi kaydedildi: {filename}")
+                buf = io.StringIO()
+                buf.write("# Komşuluk Matrisi\n")
+                buf.write(f"# Düğüm sırası: {node_ids}\n\n")
+                
+                # Header
+                buf.write("     " + " ".join(f"{nid:5}" for nid in node_ids) + "\n")
+                buf.write("-" * (6 + 6 * len(node_ids)) + "\n")
+                
+                # Matrix rows, formatted by NumPy: "  id| w.ww w.ww ..."
+                n = len(node_ids)
+                rows = np.column_stack([np.asarray(node_ids, dtype=np.float64),
+                                        np.asarray(matrix, dtype=np.float64).reshape(n, n)])
+                row_fmt = "%4d|" + " ".join(["%5.2f"] * n)
+                
+                f = open(filename, 'wb')
+                f.write(buf.getvalue().encode('utf-8'))
             except Exception as e:
+                if f is not None:
+                    self._discard_partial_file(f, filename)
                 QMessageBox.critical(self, "Hata", f"Dosya kaydedilemedi:\n{str(e)}")
+                return
+            
+            self._matrix_export = (f, filename, rows, row_fmt, 0)
+            self.cancel_export_btn.show()
+            self._show_status(f"Komşuluk matrisi kaydediliyor: {filename}")
+            QTimer.singleShot(0, self._export_matrix_step)
+    
+    def _export_matrix_step(self):
+        """Write the next chunk of matrix rows, then yield to the event loop."""
+        if self._matrix_export is None:
+            return  # Cancelled
+        
+        f, filename, rows, row_fmt, start = self._matrix_export
+        end = start + self.EXPORT_CHUNK_ROWS
+        try:
+            if start < len(rows):
+                buf = io.StringIO()
+                np.savetxt(buf, rows[start:end], fmt=row_fmt)
+                f.write(buf.getvalue().encode('utf-8'))
+        except Exception as e:
+            self._end_matrix_export(discard=True)
+            QMessageBox.critical(self, "Hata", f"Dosya kaydedilemedi:\n{str(e)}")
+            return
+        
+        if end < len(rows):
+            self._matrix_export = (f, filename, rows, row_fmt, end)
+            QTimer.singleShot(0, self._export_matrix_step)
+        else:
+            self._end_matrix_export()
+            self._show_status(f"Komşuluk matrisi kaydedildi: {filename}")
+    
+    def _cancel_matrix_export(self):
+        """Abort a running matrix export and remove the partial file."""
+        if self._matrix_export is None:
+            return
+        
+        self._end_matrix_export(discard=True)
+        self._show_status("Dışa aktarma iptal edildi")
+    
+    def _end_matrix_export(self, discard: bool = False):
+        """Close the export file and reset the export state."""
+        f, filename = self._matrix_export[:2]
+        self._matrix_export = None
+        self.cancel_export_btn.hide()
+        if discard:
+            self._discard_partial_file(f, filename)
+        else:
+            f.close()
+    
+    @staticmethod
+    def _discard_partial_file(f, filename: str):
+        """Close an unfinished export file and delete it."""
+        f.close()
+        try:
+            os.remove(filename)
+        except OSError:
+            pass
     
     def _clear_selections(self):
         """Clear all selections on canvas."""
@@ -398,14 +634,19 @@ class MainWindow(QMainWindow):
     
     def closeEvent(self, event):
         """Handle window close event."""
-        reply = QMessageBox.question(
-            self, "Çıkış",
-            "Uygulamadan çıkmak istiyor musunuz?",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
-        )
-        
-        if reply == QMessageBox.StandardButton.Yes:
-            event.accept()
-        else:
-            event.ignore()
+        if self.graph.nodes:
+            reply = QMessageBox.question(
+                self, "Çıkış",
+                "Uygulamadan çıkmak istiyor musunuz?",
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+                QMessageBox.StandardButton.Yes
+            )
+            if reply != QMessageBox.StandardButton.Yes:
+                event.ignore()
+                return
+        
+        # Stop a running export rather than leave a half-written file
+        self._cancel_matrix_export()
+        self._wait_json_io()
+        event.accept()
 
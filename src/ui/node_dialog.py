@@ -94,6 +94,15 @@ class NodeDialog(QDialog):
         buttons_layout.addWidget(save_btn)
         
         layout.addLayout(buttons_layout)
+        
+        # (property name, bound value getter) pairs read back by get_data
+        self._fields = (
+            ('name', self.name_input.text),
+            ('activity', self.activity_input.value),
+            ('interaction', self.interaction_input.value),
+            ('x', self.x_input.value),
+            ('y', self.y_input.value),
+        )
     
     def get_data(self) -> dict:
         """
@@ -102,12 +111,6 @@ class NodeDialog(QDialog):
         Returns:
             Dictionary of updated properties
         """
-        return {
-            'name': self.name_input.text(),
-            'activity': self.activity_input.value(),
-            'interaction': self.interaction_input.value(),
-            'x': self.x_input.value(),
-            'y': self.y_input.value()
-        }
+        return {key: getter() for key, getter in self._fields}
 
 
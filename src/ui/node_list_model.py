@@ -0,0 +1,99 @@
+"""
+List model exposing graph nodes to Qt item views (combo boxes, lists).
+"""
+from typing import Any, Dict, Iterable, List
+
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex
+
+from ..models.graph import Graph
+from ..models.node import Node
+
+
+class NodeListModel(QAbstractListModel):
+    """
+    Model listing the nodes of a graph as "id - name" rows.
+    
+    The model observes its graph, so rows are inserted and removed
+    incrementally as nodes are added or removed anywhere in the app. The
+    node ID is available through Qt.ItemDataRole.UserRole.
+    """
+    
+    def __init__(self, graph: Graph, parent=None):
+        super().__init__(parent)
+        self.graph = graph
+        self._ids: List[int] = list(graph.nodes)
+        self._rows: Dict[int, int] = {nid: row for row, nid in enumerate(self._ids)}
+        graph.add_node_observer(self._on_nodes_changed)
+    
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Return the number of listed nodes."""
+        if parent.isValid():
+            return 0
+        return len(self._ids)
+    
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        """Return display text or node ID for the given row."""
+        if not index.isValid() or index.row() >= len(self._ids):
+            return None
+        
+        node_id = self._ids[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            node = self.graph.nodes.get(node_id)
+            return f"{node_id} - {node.name}" if node else str(node_id)
+        if role == Qt.ItemDataRole.UserRole:
+            return node_id
+        return None
+    
+    def _on_nodes_changed(self, event: str, payload: Any) -> None:
+        """Follow a node set change reported by the graph."""
+        if event == 'added':
+            self.append_nodes(payload)
+        elif event == 'removed':
+            self.remove_node(payload)
+        else:
+            self.reload()
+    
+    def append_nodes(self, nodes: Iterable[Node]) -> None:
+        """Append several node rows with a single insert notification."""
+        new_ids = [node.id for node in nodes]
+        if not new_ids:
+            return
+        
+        first = len(self._ids)
+        self.beginInsertRows(QModelIndex(), first, first + len(new_ids) - 1)
+        self._ids.extend(new_ids)
+        self._rows.update((nid, first + i) for i, nid in enumerate(new_ids))
+        self.endInsertRows()
+    
+    def remove_node(self, node_id: int) -> None:
+        """Remove the row of a node if present."""
+        row = self._rows.pop(node_id, None)
+        if row is None:
+            return
+        
+        # The last row moves into the gap, so no other row shifts
+        last = len(self._ids) - 1
+        if row != last:
+            last_id = self._ids[last]
+            self._ids[row] = last_id
+            self._rows[last_id] = row
+            index = self.index(row)
+            self.dataChanged.emit(index, index)
+        
+        self.beginRemoveRows(QModelIndex(), last, last)
+        self._ids.pop()
+        self.endRemoveRows()
+    
+    def set_graph(self, graph: Graph) -> None:
+        """Observe a different graph and reload all rows."""
+        self.graph.remove_node_observer(self._on_nodes_changed)
+        self.graph = graph
+        graph.add_node_observer(self._on_nodes_changed)
+        self.reload()
+    
+    def reload(self) -> None:
+        """Rebuild all rows from the graph."""
+        self.beginResetModel()
+        self._ids = list(self.graph.nodes)
+        self._rows = {nid: row for row, nid in enumerate(self._ids)}
+        self.endResetModel()
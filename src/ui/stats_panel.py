@@ -30,9 +30,14 @@ class StatCard(QFrame):
         self.value_label.setObjectName("statLabel")
         self.value_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(self.value_label)
+        
+        self._last = value
     
     def set_value(self, value: str):
-        """Update the displayed value."""
+        """Update the displayed value (skipped when unchanged)."""
+        if value == self._last:
+            return
+        self._last = value
         self.value_label.setText(value)
 
 
@@ -44,6 +49,7 @@ class StatsPanel(QWidget):
     def __init__(self, graph: Graph):
         super().__init__()
         self.graph = graph
+        self._last_seen = None  # (graph, version) of the last update
         self._init_ui()
     
     def _init_ui(self):
@@ -96,6 +102,13 @@ class StatsPanel(QWidget):
         if not self.graph:
             return
         
+        # Nothing to do if the graph has not changed since the last update
+        if self._last_seen is not None:
+            last_graph, last_version = self._last_seen
+            if last_graph is self.graph and last_version == self.graph.version:
+                return
+        self._last_seen = (self.graph, self.graph.version)
+        
         stats = self.graph.get_statistics()
         
         self.node_card.set_value(str(stats['node_count']))
@@ -109,32 +122,4 @@ class StatsPanel(QWidget):
         k = stats['average_degree']
         self.k_card.set_value(f"{k:.2f}")
         
-        # Calculate connected components
-        self._update_components()
-    
-    def _update_components(self):
-        """Update connected components count."""
-        if not self.graph.nodes:
-            self.component_card.set_value("0")
-            return
-        
-        # Simple component counting using BFS
-        visited = set()
-        components = 0
-        
-        for node_id in self.graph.nodes:
-            if node_id not in visited:
-                components += 1
-                # BFS
-                queue = [node_id]
-                while queue:
-                    current = queue.pop(0)
-                    if current in visited:
-                        continue
-                    visited.add(current)
-                    for neighbor in self.graph.get_neighbor_ids(current):
-                        if neighbor not in visited:
-                            queue.append(neighbor)
-        
-        self.component_card.set_value(str(components))
-
+        self.component_card.set_value(str(stats['component_count']))
@@ -1,6 +1,6 @@
-from .data_handler import DataHandler
-from .weight_calculator import WeightCalculator
+from . import data_handler
+from . import weight_calculator
 
-__all__ = ['DataHandler', 'WeightCalculator']
+__all__ = ['data_handler', 'weight_calculator']
 
 
@@ -1,261 +1,359 @@
 """
-Data import/export handler for JSON and CSV formats.
+Data import/export functions for JSON and CSV formats.
 """
+import io
 import json
 import csv
-from typing import TYPE_CHECKING
+import mmap
+from typing import Any, TYPE_CHECKING
 import os
 
+import numpy as np
+
 if TYPE_CHECKING:
     from ..models.graph import Graph
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to the standard library
+    orjson = None
+
 
-class DataHandler:
+def write_text(filename: str, text: str) -> None:
     """
-    Handles import/export of graph data in JSON and CSV formats.
+    Write a text export as UTF-8, keeping its line endings as given.
+    
+    The text is encoded once and written in binary mode, bypassing the
+    incremental encoder and newline translation of text-mode files.
+    
+    Args:
+        filename: Output filename
+        text: Complete file contents
+    """
+    with open(filename, 'wb') as f:
+        f.write(text.encode('utf-8'))
+
+
+def dumps_json(data: Any) -> bytes:
     """
+    Serialize data to indented UTF-8 JSON bytes.
     
-    @staticmethod
-    def export_json(graph: 'Graph', filename: str) -> None:
-        """
-        Export graph to JSON file.
-        
-        Args:
-            graph: Graph to export
-            filename: Output filename
-        """
-        data = graph.to_dict()
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-    
-    @staticmethod
-    def import_json(filename: str) -> 'Graph':
-        """
-        Import graph from JSON file.
-        
-        Args:
-            filename: Input filename
-            
-        Returns:
-            Loaded Graph instance
-        """
-        from ..models.graph import Graph
-        
-        with open(filename, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        return Graph.from_dict(data)
+    Uses orjson when it is installed, the standard library otherwise.
     
-    @staticmethod
-    def export_csv(graph: 'Graph', filename: str) -> None:
-        """
-        Export graph to CSV file.
+    Args:
+        data: JSON-serializable data
         
-        Format follows project specification:
-        DugumId, Ozellik_I (Aktiflik), Ozellik_II (Etkileşim), Ozellik_III (Bağl. Sayısı), Komsular
+    Returns:
+        Encoded JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def loads_json(raw: bytes) -> Any:
+    """
+    Parse UTF-8 JSON bytes, using orjson when it is installed.
+    
+    Args:
+        raw: Encoded JSON document
         
-        Args:
-            graph: Graph to export
-            filename: Output filename
-        """
-        with open(filename, 'w', encoding='utf-8', newline='') as f:
-            writer = csv.writer(f)
-            
-            # Header
-            writer.writerow([
-                'DugumId', 'Isim', 'Ozellik_I (Aktiflik)', 
-                'Ozellik_II (Etkilesim)', 'Ozellik_III (Bagl. Sayisi)',
-                'X', 'Y', 'Komsular'
-            ])
-            
-            # Data rows
-            for node in graph.nodes.values():
-                neighbors = graph.get_neighbor_ids(node.id)
-                neighbors_str = ','.join(map(str, neighbors)) if neighbors else ''
-                
-                writer.writerow([
-                    node.id,
-                    node.name,
-                    round(node.activity, 2),
-                    round(node.interaction, 2),
-                    node.connection_count,
-                    round(node.x, 2),
-                    round(node.y, 2),
-                    neighbors_str
-                ])
-    
-    @staticmethod
-    def import_csv(filename: str) -> 'Graph':
-        """
-        Import graph from CSV file.
+    Returns:
+        Parsed data
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode('utf-8'))
+
+
+def export_json(graph: 'Graph', filename: str) -> None:
+    """
+    Export graph to JSON file.
+    
+    Args:
+        graph: Graph to export
+        filename: Output filename
+    """
+    with open(filename, 'wb') as f:
+        f.write(dumps_json(graph.to_dict()))
+
+
+def import_json(filename: str) -> 'Graph':
+    """
+    Import graph from JSON file.
+    
+    With orjson installed, the file is memory-mapped and parsed in place
+    instead of being read into an intermediate bytes object.
+    
+    Args:
+        filename: Input filename
         
-        Args:
-            filename: Input filename
-            
-        Returns:
-            Loaded Graph instance
-        """
-        from ..models.graph import Graph
-        from ..models.node import Node
+    Returns:
+        Loaded Graph instance
+    """
+    from ..models.graph import Graph
+    
+    with open(filename, 'rb') as f:
+        if orjson is not None and os.fstat(f.fileno()).st_size > 0:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    data = orjson.loads(view)
+        else:
+            data = loads_json(f.read())
+    
+    return Graph.from_dict(data)
+
+
+def export_csv(graph: 'Graph', filename: str) -> None:
+    """
+    Export graph to CSV file.
+    
+    Format follows project specification:
+    DugumId, Ozellik_I (Aktiflik), Ozellik_II (Etkileşim), Ozellik_III (Bağl. Sayısı), Komsular
+    
+    Args:
+        graph: Graph to export
+        filename: Output filename
+    """
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    
+    # Header
+    writer.writerow([
+        'DugumId', 'Isim', 'Ozellik_I (Aktiflik)', 
+        'Ozellik_II (Etkilesim)', 'Ozellik_III (Bagl. Sayisi)',
+        'X', 'Y', 'Komsular'
+    ])
+    
+    # Data rows, formatted in memory and written in one go
+    adjacency = graph.adjacency_view()
+    writer.writerows(
+        (
+            node.id,
+            node.name,
+            f"{node.activity:.2f}",
+            f"{node.interaction:.2f}",
+            node.connection_count,
+            f"{node.x:.2f}",
+            f"{node.y:.2f}",
+            ','.join(map(str, adjacency[node.id]))
+        )
+        for node in graph.nodes.values()
+    )
+    
+    write_text(filename, buf.getvalue())
+
+
+def import_csv(filename: str) -> 'Graph':
+    """
+    Import graph from CSV file.
+    
+    Args:
+        filename: Input filename
         
-        graph = Graph()
-        edges_to_add = []
+    Returns:
+        Loaded Graph instance
+    """
+    from ..models.graph import Graph
+    from ..models.node import Node
+    
+    graph = Graph()
+    neighbor_sources = []
+    neighbor_fields = []
+    
+    with open(filename, 'r', encoding='utf-8') as f:
+        reader = csv.reader(f)
         
-        with open(filename, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            
-            for row in reader:
-                # Parse node data
-                node_id = int(row.get('DugumId', row.get('id', 0)))
-                name = row.get('Isim', row.get('name', f'User_{node_id}'))
-                activity = float(row.get('Ozellik_I (Aktiflik)', row.get('activity', 0.5)))
-                interaction = float(row.get('Ozellik_II (Etkilesim)', row.get('interaction', 10)))
-                x = float(row.get('X', row.get('x', 0)))
-                y = float(row.get('Y', row.get('y', 0)))
-                
-                # Create node
-                node = Node(
-                    id=node_id,
-                    name=name,
-                    activity=activity,
-                    interaction=interaction,
-                    x=x if x != 0 else None,
-                    y=y if y != 0 else None
-                )
-                
-                try:
-                    graph.add_node(node)
-                except ValueError:
-                    pass  # Node already exists
-                
-                # Store neighbors for edge creation
-                neighbors_str = row.get('Komsular', row.get('neighbors', ''))
-                if neighbors_str:
-                    neighbor_ids = [int(n.strip()) for n in neighbors_str.split(',') if n.strip()]
-                    for neighbor_id in neighbor_ids:
-                        edges_to_add.append((node_id, neighbor_id))
+        # Resolve each column (spec name, then short name) to its position once
+        fields = {name: i for i, name in enumerate(next(reader, []))}
         
-        # Add edges (avoid duplicates)
-        added_edges = set()
-        for source_id, target_id in edges_to_add:
-            edge_key = frozenset([source_id, target_id])
-            if edge_key not in added_edges:
-                if source_id in graph.nodes and target_id in graph.nodes:
-                    graph.add_edge(source_id, target_id)
-                    added_edges.add(edge_key)
+        def column(*names):
+            return next((fields[name] for name in names if name in fields), None)
         
-        return graph
-    
-    @staticmethod
-    def export_adjacency_list(graph: 'Graph', filename: str) -> None:
-        """
-        Export adjacency list to text file.
+        def cell(row, col, default):
+            # Rows may leave off trailing optional columns
+            return row[col] if col is not None and col < len(row) else default
         
-        Args:
-            graph: Graph to export
-            filename: Output filename
-        """
-        adj_list = graph.get_adjacency_list()
+        id_col = column('DugumId', 'id')
+        name_col = column('Isim', 'name')
+        activity_col = column('Ozellik_I (Aktiflik)', 'activity')
+        interaction_col = column('Ozellik_II (Etkilesim)', 'interaction')
+        x_col = column('X', 'x')
+        y_col = column('Y', 'y')
+        neighbors_col = column('Komsular', 'neighbors')
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write("# Komşuluk Listesi\n")
-            f.write("# Format: DüğümID (İsim): [Komşu1, Komşu2, ...]\n\n")
+        for row in reader:
+            if not row:
+                continue  # Blank line
             
-            for node_id in sorted(adj_list.keys()):
-                node = graph.nodes[node_id]
-                neighbors = adj_list[node_id]
-                neighbor_names = [graph.nodes[n].name for n in neighbors]
-                
-                f.write(f"{node_id} ({node.name}): {neighbors}\n")
-                f.write(f"  -> İsimler: {neighbor_names}\n")
-    
-    @staticmethod
-    def export_adjacency_matrix(graph: 'Graph', filename: str) -> None:
-        """
-        Export adjacency matrix to text file.
-        
-        Args:
-            graph: Graph to export
-            filename: Output filename
-        """
-        matrix, node_ids = graph.get_adjacency_matrix()
-        
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write("# Komşuluk Matrisi (Ağırlık Değerleri)\n")
-            f.write(f"# Düğüm sırası: {node_ids}\n")
-            f.write(f"# Düğüm sayısı: {len(node_ids)}\n\n")
+            # Parse node data
+            node_id = int(cell(row, id_col, 0))
+            x = float(cell(row, x_col, 0.0))
+            y = float(cell(row, y_col, 0.0))
             
-            # Header row with node IDs
-            header = "      " + "  ".join(f"{nid:5}" for nid in node_ids)
-            f.write(header + "\n")
-            f.write("-" * len(header) + "\n")
+            # Create node
+            node = Node(
+                id=node_id,
+                name=cell(row, name_col, f'User_{node_id}'),
+                activity=float(cell(row, activity_col, 0.5)),
+                interaction=float(cell(row, interaction_col, 10.0)),
+                x=x if x != 0 else None,
+                y=y if y != 0 else None
+            )
             
-            # Matrix rows
-            for i, row in enumerate(matrix):
-                row_str = f"{node_ids[i]:5}|"
-                row_str += "  ".join(f"{val:5.2f}" for val in row)
-                f.write(row_str + "\n")
-    
-    @staticmethod
-    def generate_sample_data(node_count: int, edge_probability: float = 0.3) -> 'Graph':
-        """
-        Generate sample graph data for testing.
-        
-        Args:
-            node_count: Number of nodes to generate
-            edge_probability: Probability of edge between any two nodes
+            try:
+                graph.add_node(node)
+            except ValueError:
+                pass  # Node already exists
             
-        Returns:
-            Generated Graph instance
-        """
-        import random
-        from ..models.graph import Graph
-        
-        graph = Graph()
-        
-        # Turkish names for sample data
-        names = [
-            "Ahmet", "Mehmet", "Ayşe", "Fatma", "Ali", "Veli", 
-            "Zeynep", "Elif", "Mustafa", "Hüseyin", "Hatice", "Emine",
-            "Ömer", "Yusuf", "İbrahim", "Osman", "Aslı", "Selin",
-            "Burak", "Emre", "Deniz", "Cem", "Can", "Arda",
-            "Berk", "Kaan", "Mert", "Ece", "İrem", "Defne",
-            "Yağmur", "Nehir", "Derya", "Sevgi", "Gül", "Çiçek",
-            "Barış", "Serkan", "Tolga", "Onur", "Kemal", "Selim",
-            "Leyla", "Merve", "Büşra", "Gamze", "Hande", "Seda",
-            "Taner", "Volkan", "Sinan", "Erhan", "Gökhan", "Özgür",
-            "Pelin", "Nazlı", "Burcu", "Ceren", "Dilara", "Simge"
-        ]
+            # Store neighbors for edge creation, parsed in bulk below
+            neighbors_str = cell(row, neighbors_col, '')
+            if neighbors_str:
+                neighbor_sources.append(node_id)
+                neighbor_fields.append(neighbors_str)
+    
+    # Split every neighbor field at once; each token inherits its row's ID
+    edges_to_add = []
+    if neighbor_fields:
+        tokens = np.char.strip(np.array(','.join(neighbor_fields).split(',')))
+        counts = [field.count(',') + 1 for field in neighbor_fields]
+        sources = np.repeat(np.array(neighbor_sources, dtype=np.int64), counts)
+        present = tokens != ''
+        edges_to_add = zip(sources[present].tolist(),
+                           tokens[present].astype(np.int64).tolist())
+    
+    # Deduplicate on the sorted ID pair, keeping the first occurrence in order
+    nodes = graph.nodes
+    unique_edges = {}
+    for source_id, target_id in edges_to_add:
+        if source_id in nodes and target_id in nodes:
+            key = (source_id, target_id) if source_id < target_id else (target_id, source_id)
+            unique_edges.setdefault(key, (source_id, target_id))
+    
+    graph.add_edges_from(list(unique_edges.values()))
+    
+    return graph
+
+
+def export_adjacency_list(graph: 'Graph', filename: str) -> None:
+    """
+    Export adjacency list to text file.
+    
+    Args:
+        graph: Graph to export
+        filename: Output filename
+    """
+    adjacency = graph.adjacency_view()
+    
+    lines = [
+        "# Komşuluk Listesi\n",
+        "# Format: DüğümID (İsim): [Komşu1, Komşu2, ...]\n\n"
+    ]
+    name_of = {nid: node.name for nid, node in graph.nodes.items()}
+    for node_id in sorted(adjacency):
+        neighbors = adjacency[node_id]
+        neighbor_names = [name_of[n] for n in neighbors]
         
-        # Generate nodes in a circular layout
-        import math
-        center_x, center_y = 400, 300
-        radius = min(300, 50 + node_count * 8)
+        lines.append(f"{node_id} ({name_of[node_id]}): {list(neighbors)}\n")
+        lines.append(f"  -> İsimler: {neighbor_names}\n")
+    
+    write_text(filename, "".join(lines))
+
+
+def export_adjacency_matrix(graph: 'Graph', filename: str) -> None:
+    """
+    Export adjacency matrix to text file.
+    
+    Args:
+        graph: Graph to export
+        filename: Output filename
+    """
+    matrix, node_ids = graph.get_adjacency_matrix()
+    
+    lines = [
+        "# Komşuluk Matrisi (Ağırlık Değerleri)\n",
+        f"# Düğüm sırası: {node_ids}\n",
+        f"# Düğüm sayısı: {len(node_ids)}\n\n"
+    ]
+    
+    # Header row with node IDs
+    header = "      " + "  ".join(f"{nid:5}" for nid in node_ids)
+    lines.append(header + "\n")
+    lines.append("-" * len(header) + "\n")
+    
+    buf = io.StringIO()
+    buf.writelines(lines)
+    
+    # Matrix rows, formatted by NumPy: "   id| w.ww  w.ww ..."
+    n = len(node_ids)
+    if n:
+        rows = np.column_stack([np.asarray(node_ids, dtype=np.float64),
+                                np.asarray(matrix, dtype=np.float64)])
+        np.savetxt(buf, rows, fmt="%5d|" + "  ".join(["%5.2f"] * n))
+    
+    write_text(filename, buf.getvalue())
+
+
+def generate_sample_data(node_count: int, edge_probability: float = 0.3) -> 'Graph':
+    """
+    Generate sample graph data for testing.
+    
+    Args:
+        node_count: Number of nodes to generate
+        edge_probability: Probability of edge between any two nodes
         
-        for i in range(node_count):
-            angle = 2 * math.pi * i / node_count
-            x = center_x + radius * math.cos(angle)
-            y = center_y + radius * math.sin(angle)
-            
-            name = names[i % len(names)]
-            if i >= len(names):
-                name = f"{name}_{i // len(names)}"
-            
-            graph.add_node(
-                name=name,
-                x=x,
-                y=y,
-                activity=random.uniform(0.1, 1.0),
-                interaction=random.uniform(1, 50)
-            )
+    Returns:
+        Generated Graph instance
+    """
+    from ..models.graph import Graph
+    
+    graph = Graph()
+    rng = np.random.default_rng()
+    
+    # Turkish names for sample data
+    names = [
+        "Ahmet", "Mehmet", "Ayşe", "Fatma", "Ali", "Veli", 
+        "Zeynep", "Elif", "Mustafa", "Hüseyin", "Hatice", "Emine",
+        "Ömer", "Yusuf", "İbrahim", "Osman", "Aslı", "Selin",
+        "Burak", "Emre", "Deniz", "Cem", "Can", "Arda",
+        "Berk", "Kaan", "Mert", "Ece", "İrem", "Defne",
+        "Yağmur", "Nehir", "Derya", "Sevgi", "Gül", "Çiçek",
+        "Barış", "Serkan", "Tolga", "Onur", "Kemal", "Selim",
+        "Leyla", "Merve", "Büşra", "Gamze", "Hande", "Seda",
+        "Taner", "Volkan", "Sinan", "Erhan", "Gökhan", "Özgür",
+        "Pelin", "Nazlı", "Burcu", "Ceren", "Dilara", "Simge"
+    ]
+    
+    # Generate nodes in a circular layout; coordinates and properties
+    # are drawn for all nodes at once
+    center_x, center_y = 400, 300
+    radius = min(300, 50 + node_count * 8)
+    
+    angles = np.linspace(0.0, 2 * np.pi, node_count, endpoint=False)
+    xs = (center_x + radius * np.cos(angles)).tolist()
+    ys = (center_y + radius * np.sin(angles)).tolist()
+    activities = rng.uniform(0.1, 1.0, node_count).tolist()
+    interactions = rng.uniform(1, 50, node_count).tolist()
+    
+    for i in range(node_count):
+        name = names[i % len(names)]
+        if i >= len(names):
+            name = f"{name}_{i // len(names)}"
         
-        # Generate edges randomly
-        node_ids = list(graph.nodes.keys())
+        graph.add_node(
+            name=name,
+            x=xs[i],
+            y=ys[i],
+            activity=activities[i],
+            interaction=interactions[i]
+        )
+    
+    # Generate edges randomly, one vectorized draw per source node
+    node_ids = list(graph.nodes.keys())
+    with graph.bulk_insert():
         for i, source_id in enumerate(node_ids):
-            for target_id in node_ids[i + 1:]:
-                if random.random() < edge_probability:
-                    graph.add_edge(source_id, target_id)
-        
-        return graph
-
-
+            hits = np.flatnonzero(rng.random(node_count - i - 1) < edge_probability)
+            for offset in hits.tolist():
+                graph.add_edge(source_id, node_ids[i + 1 + offset])
+    
+    return graph
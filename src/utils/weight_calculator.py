@@ -1,110 +1,167 @@
 """
-Weight Calculator for dynamic edge weight computation.
+Weight calculation for dynamic edge weight computation.
+
+Edge weights follow the project formula:
+
+Weight(i,j) = 1 / (1 + sqrt((Activity_i - Activity_j)^2 + 
+                             (Interaction_i - Interaction_j)^2 + 
+                             (Connection_i - Connection_j)^2))
 """
 import math
-from typing import TYPE_CHECKING
+import threading
+from typing import Tuple, TYPE_CHECKING
+
+import numpy as np
 
 if TYPE_CHECKING:
     from ..models.node import Node
 
+try:
+    from numba import njit
+except ImportError:  # Optional speedup; the pure Python kernel is used instead
+    njit = None
+
+
+def _distance_scalar(a1: float, i1: float, c1: float,
+                     a2: float, i2: float, c2: float) -> float:
+    """Property-space distance on raw values."""
+    da = a1 - a2
+    di = i1 - i2
+    dc = c1 - c2
+    return math.sqrt(da * da + di * di + dc * dc)
+
+
+if njit is not None:
+    # No fastmath, so results stay identical to calculate_weights_batch
+    _distance_scalar = njit(cache=True)(_distance_scalar)
+
+
+def _compute_distance(node1: 'Node', node2: 'Node') -> float:
+    """Euclidean distance between two nodes in property space."""
+    return _distance_scalar(
+        node1.activity, node1.interaction, float(node1.connection_count),
+        node2.activity, node2.interaction, float(node2.connection_count)
+    )
+
+
+# Per-thread scratch arrays for calculate_weights_batch, grown on demand
+_batch_buffers = threading.local()
 
-class WeightCalculator:
+
+def calculate_weight(node1: 'Node', node2: 'Node') -> float:
     """
-    Calculates edge weights based on node properties using the project formula.
+    Calculate the weight between two nodes.
     
-    Formula:
-    Weight(i,j) = 1 / (1 + sqrt((Activity_i - Activity_j)^2 + 
-                                 (Interaction_i - Interaction_j)^2 + 
-                                 (Connection_i - Connection_j)^2))
-    """
+    Higher weight = more similar nodes (shorter distance)
+    Lower weight = less similar nodes (longer distance)
     
-    @staticmethod
-    def calculate_weight(node1: 'Node', node2: 'Node') -> float:
-        """
-        Calculate the weight between two nodes.
-        
-        Higher weight = more similar nodes (shorter distance)
-        Lower weight = less similar nodes (longer distance)
-        
-        Args:
-            node1: First node
-            node2: Second node
-            
-        Returns:
-            Calculated weight (0 to 1)
-        """
-        activity_diff = node1.activity - node2.activity
-        interaction_diff = node1.interaction - node2.interaction
-        connection_diff = node1.connection_count - node2.connection_count
-        
-        # Euclidean distance in property space
-        euclidean_distance = math.sqrt(
-            activity_diff ** 2 + 
-            interaction_diff ** 2 + 
-            connection_diff ** 2
-        )
+    Args:
+        node1: First node
+        node2: Second node
         
-        # Weight formula from project specification
-        weight = 1.0 / (1.0 + euclidean_distance)
-        
-        return weight
+    Returns:
+        Calculated weight (0 to 1)
+    """
+    # Euclidean distance in property space, mapped to (0, 1]
+    return 1.0 / (1.0 + _compute_distance(node1, node2))
+
+
+def _scratch_buffers(size: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return three float64 scratch arrays of the given length."""
+    buffer = getattr(_batch_buffers, 'buffer', None)
+    if buffer is None or buffer.shape[1] < size:
+        buffer = np.empty((3, size), dtype=np.float64)
+        _batch_buffers.buffer = buffer
+    return buffer[0, :size], buffer[1, :size], buffer[2, :size]
+
+
+def calculate_weights_batch(activities: np.ndarray, interactions: np.ndarray,
+                            connections: np.ndarray, pairs_i: np.ndarray,
+                            pairs_j: np.ndarray) -> np.ndarray:
+    """
+    Calculate the weights of many node pairs in one vectorized pass.
     
-    @staticmethod
-    def calculate_cost(node1: 'Node', node2: 'Node') -> float:
-        """
-        Calculate the cost (inverse of weight) for pathfinding.
-        
-        Used in Dijkstra and A* algorithms where we want to find
-        paths through similar nodes.
+    Node properties are given as parallel arrays indexed by node
+    position; each pair (pairs_i[k], pairs_j[k]) gets the same weight
+    calculate_weight would return for the corresponding nodes.
+    
+    Args:
+        activities: Activity value per node
+        interactions: Interaction value per node
+        connections: Connection count per node
+        pairs_i: Index of the first node of each pair
+        pairs_j: Index of the second node of each pair
         
-        Args:
-            node1: First node
-            node2: Second node
-            
-        Returns:
-            Cost value (higher for dissimilar nodes)
-        """
-        weight = WeightCalculator.calculate_weight(node1, node2)
-        if weight <= 0:
-            return float('inf')
-        return 1.0 / weight
+    Returns:
+        Array of weights, one per pair
+    """
+    pairs_i = np.asarray(pairs_i, dtype=np.intp)
+    pairs_j = np.asarray(pairs_j, dtype=np.intp)
+    first, second, total = _scratch_buffers(len(pairs_i))
+    
+    # Intermediates live in reused per-thread buffers; only the result
+    # array is allocated per call
+    for k, values in enumerate((activities, interactions, connections)):
+        values = np.asarray(values, dtype=np.float64)
+        np.take(values, pairs_i, out=first)
+        np.take(values, pairs_j, out=second)
+        np.subtract(first, second, out=first)
+        np.square(first, out=first if k else total)
+        if k:
+            np.add(total, first, out=total)
+    
+    weights = np.sqrt(total)
+    np.add(weights, 1.0, out=weights)
+    return np.divide(1.0, weights, out=weights)
+
+
+def calculate_cost(node1: 'Node', node2: 'Node') -> float:
+    """
+    Calculate the cost (inverse of weight) for pathfinding.
     
-    @staticmethod
-    def calculate_similarity_score(node1: 'Node', node2: 'Node') -> float:
-        """
-        Calculate a normalized similarity score (0 to 100).
+    Used in Dijkstra and A* algorithms where we want to find
+    paths through similar nodes.
+    
+    Args:
+        node1: First node
+        node2: Second node
         
-        Args:
-            node1: First node
-            node2: Second node
-            
-        Returns:
-            Similarity percentage
-        """
-        weight = WeightCalculator.calculate_weight(node1, node2)
-        return weight * 100
+    Returns:
+        Cost value (higher for dissimilar nodes)
+    """
+    # 1 / weight, simplified: 1 / (1 / (1 + d)) = 1 + d
+    return 1.0 + _compute_distance(node1, node2)
+
+
+def calculate_similarity_score(node1: 'Node', node2: 'Node') -> float:
+    """
+    Calculate a normalized similarity score (0 to 100).
     
-    @staticmethod
-    def get_property_differences(node1: 'Node', node2: 'Node') -> dict:
-        """
-        Get detailed property differences between two nodes.
+    Args:
+        node1: First node
+        node2: Second node
         
-        Args:
-            node1: First node
-            node2: Second node
-            
-        Returns:
-            Dictionary with individual property differences
-        """
-        return {
-            'activity_diff': abs(node1.activity - node2.activity),
-            'interaction_diff': abs(node1.interaction - node2.interaction),
-            'connection_diff': abs(node1.connection_count - node2.connection_count),
-            'total_distance': math.sqrt(
-                (node1.activity - node2.activity) ** 2 +
-                (node1.interaction - node2.interaction) ** 2 +
-                (node1.connection_count - node2.connection_count) ** 2
-            )
-        }
+    Returns:
+        Similarity percentage
+    """
+    weight = calculate_weight(node1, node2)
+    return weight * 100
 
 
+def get_property_differences(node1: 'Node', node2: 'Node') -> dict:
+    """
+    Get detailed property differences between two nodes.
+    
+    Args:
+        node1: First node
+        node2: Second node
+        
+    Returns:
+        Dictionary with individual property differences
+    """
+    return {
+        'activity_diff': abs(node1.activity - node2.activity),
+        'interaction_diff': abs(node1.interaction - node2.interaction),
+        'connection_diff': abs(node1.connection_count - node2.connection_count),
+        'total_distance': _compute_distance(node1, node2)
+    }
@@ -0,0 +1,12 @@
+"""
+Pytest fixtures shared by the test modules.
+"""
+import pytest
+
+from .test_algorithms import shared_test_graph
+
+
+@pytest.fixture(scope="session")
+def graph():
+    """Test graph for the algorithm tests, built once per session."""
+    return shared_test_graph()
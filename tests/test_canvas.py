@@ -0,0 +1,173 @@
+"""
+Test module for the GraphCanvas position arrays and live physics.
+"""
+import sys
+import os
+
+import numpy as np
+
+# Render without a display
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QApplication
+
+from src.models.graph import Graph
+from src.ui.graph_canvas import GraphCanvas
+from src.ui.node_list_model import NodeListModel
+
+app = QApplication.instance() or QApplication(sys.argv)
+
+
+def create_canvas(node_count=6):
+    """Create a canvas showing a path graph of nodes placed close together."""
+    graph = Graph()
+    for i in range(node_count):
+        graph.add_node(name=f"User{i}", x=400.0 + 10 * i, y=300.0 + 5 * (i % 2))
+    ids = list(graph.nodes)
+    for a, b in zip(ids, ids[1:]):
+        graph.add_edge(a, b)
+    
+    canvas = GraphCanvas(graph)
+    canvas.refresh()
+    return canvas
+
+
+def assert_positions_in_sync(canvas):
+    """Check that nodes, node items and position rows agree."""
+    for node_id, idx in canvas._nid_to_idx.items():
+        node = canvas.graph.nodes[node_id]
+        item = canvas._node_items[node_id]
+        assert (item.pos().x(), item.pos().y()) == (node.x, node.y)
+        assert tuple(canvas._pos[idx]) == (node.x, node.y)
+
+
+def test_physics_timer():
+    """Test that live physics runs on a timer while enabled."""
+    print("\n" + "=" * 50)
+    print("TEST: Live Physics Timer")
+    print("=" * 50)
+    
+    canvas = create_canvas()
+    assert not canvas._physics_timer.isActive()
+    
+    canvas.toggle_physics(True)
+    assert canvas._physics_timer.isActive()
+    
+    canvas.toggle_physics(False)
+    assert not canvas._physics_timer.isActive()
+    
+    print("[OK] Live physics timer test passed")
+
+
+def test_physics_step():
+    """Test that a physics step moves nodes and keeps items in sync."""
+    print("\n" + "=" * 50)
+    print("TEST: Live Physics Step")
+    print("=" * 50)
+    
+    canvas = create_canvas()
+    before = canvas._pos[:canvas._pos_count].copy()
+    
+    # Disabled physics leaves everything in place
+    canvas._physics_step()
+    assert np.array_equal(canvas._pos[:canvas._pos_count], before)
+    
+    canvas.toggle_physics(True)
+    for _ in range(5):
+        canvas._physics_step()
+    canvas.toggle_physics(False)
+    
+    assert not np.array_equal(canvas._pos[:canvas._pos_count], before)
+    assert_positions_in_sync(canvas)
+    
+    # A selected node pauses the simulation
+    moved = canvas._pos[:canvas._pos_count].copy()
+    next(iter(canvas._node_items.values())).setSelected(True)
+    canvas.toggle_physics(True)
+    canvas._physics_step()
+    canvas.toggle_physics(False)
+    assert np.array_equal(canvas._pos[:canvas._pos_count], moved)
+    
+    print(f"Frames recorded: {len(canvas._frame_times)}")
+    print("[OK] Live physics step test passed")
+
+
+def test_remove_node_velocity():
+    """Test that removing a node keeps velocity rows with their nodes."""
+    print("\n" + "=" * 50)
+    print("TEST: Node Removal Velocity Rows")
+    print("=" * 50)
+    
+    canvas = create_canvas()
+    n = canvas._pos_count
+    canvas._vel[:n] = np.arange(2 * n, dtype=np.float64).reshape(n, 2)
+    velocity = {nid: tuple(canvas._vel[idx]) for nid, idx in canvas._nid_to_idx.items()}
+    
+    removed_id = canvas._idx_to_nid[1]
+    canvas.graph.remove_node(removed_id)
+    canvas._remove_node_item(removed_id)
+    
+    assert canvas._pos_count == n - 1
+    for nid, idx in canvas._nid_to_idx.items():
+        assert tuple(canvas._vel[idx]) == velocity[nid]
+    assert tuple(canvas._vel[n - 1]) == (0.0, 0.0)
+    
+    print("[OK] Node removal velocity test passed")
+
+
+def test_node_list_model():
+    """Test that the node list model follows graph changes on its own."""
+    print("\n" + "=" * 50)
+    print("TEST: Node List Model")
+    print("=" * 50)
+    
+    canvas = create_canvas(4)
+    graph = canvas.graph
+    model = NodeListModel(graph)
+    
+    def listed():
+        return [model.index(row).data(Qt.ItemDataRole.UserRole)
+                for row in range(model.rowCount())]
+    
+    assert listed() == list(graph.nodes)
+    
+    # Nodes added on the canvas appear without any manual refresh
+    canvas._add_node_at_position(0.0, 0.0)
+    graph.add_nodes_bulk([100, 101], ["A", "B"], [0.5, 0.5], [10, 10])
+    assert sorted(listed()) == sorted(graph.nodes)
+    
+    canvas.delete_node(2)
+    assert sorted(listed()) == sorted(graph.nodes)
+    for row, node_id in enumerate(listed()):
+        assert model.index(row).data() == f"{node_id} - {graph.nodes[node_id].name}"
+    
+    graph.load_from_graph(create_canvas(3).graph)
+    assert listed() == list(graph.nodes)
+    graph.clear()
+    assert listed() == []
+    
+    print("[OK] Node list model test passed")
+
+
+def main():
+    """Run all tests."""
+    print("=" * 60)
+    print("SOSYAL AĞ ANALİZİ - TUVAL TESTLERİ")
+    print("=" * 60)
+    
+    test_physics_timer()
+    test_physics_step()
+    test_remove_node_velocity()
+    test_node_list_model()
+    
+    print("\n" + "=" * 60)
+    print("TÜM TESTLER BAŞARILI")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
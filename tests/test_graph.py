@@ -3,6 +3,10 @@ Test module for Graph model operations.
 """
 import sys
 import os
+import pickle
+import tempfile
+
+import numpy as np
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -10,6 +14,8 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from src.models.graph import Graph
 from src.models.node import Node
 from src.models.edge import Edge
+from src.utils.data_handler import import_csv
+from src.utils.weight_calculator import calculate_weights_batch
 
 
 def test_node_creation():
@@ -111,6 +117,25 @@ def test_duplicate_edge_prevention():
     assert edge3 is None
     assert graph.get_edge_count() == 1
     
+    # Duplicates of a high-degree node's edges are rejected in both
+    # directions without changing the graph
+    hub = node1.id
+    with graph.bulk_insert():
+        others = [graph.add_node(name=f"Leaf{i}").id for i in range(1000)]
+    for other_id in others:
+        graph.add_edge(hub, other_id)
+    
+    version = graph.version
+    adjacency = graph.get_adjacency_list()
+    for other_id in others:
+        assert graph.add_edge(hub, other_id) is None
+        assert graph.add_edge(other_id, hub) is None
+    
+    assert graph.get_edge_count() == 1001
+    assert graph.version == version
+    assert graph.get_adjacency_list() == adjacency
+    assert graph.get_edge(others[-1], hub) is graph.get_edge(hub, others[-1])
+    
     print("Duplicate edges correctly prevented")
     print("[OK] Duplicate edge prevention test passed")
 
@@ -162,6 +187,22 @@ def test_adjacency_list():
     assert n3.id in adj_list[n1.id]
     assert n1.id in adj_list[n2.id]
     
+    # Cached view matches and is rebuilt after a structural change
+    view = graph.adjacency_view()
+    assert set(view[n1.id]) == {n2.id, n3.id}
+    assert graph.adjacency_view() is view
+    graph.remove_edge(n1.id, n3.id)
+    assert graph.adjacency_view()[n1.id] == (n2.id,)
+    
+    # CSR arrays describe the same adjacency and follow changes too
+    ids, indptr, indices = graph.csr_view()
+    for p, node_id in enumerate(ids):
+        neighbors = [ids[k] for k in indices[indptr[p]:indptr[p + 1]]]
+        assert tuple(neighbors) == graph.adjacency_view()[node_id]
+    assert graph.csr_view()[1] is indptr
+    graph.add_edge(n1.id, n3.id)
+    assert graph.csr_view()[1][-1] == 2 * graph.get_edge_count()
+    
     print(f"Adjacency list: {adj_list}")
     print("[OK] Adjacency list test passed")
 
@@ -187,10 +228,20 @@ def test_adjacency_matrix():
     for row in matrix:
         print(f"  {[f'{v:.2f}' for v in row]}")
     
-    # Check symmetry (undirected)
-    for i in range(len(matrix)):
-        for j in range(len(matrix)):
-            assert matrix[i][j] == matrix[j][i]
+    # Check symmetry (undirected) and the absence of self-loops
+    m = np.asarray(matrix)
+    assert np.array_equal(m, m.T)
+    assert np.allclose(np.diag(m), 0)
+    
+    # Sparse form holds the same nonzeros and is symmetric as well
+    (data, indices, indptr), sparse_ids = graph.get_sparse_adjacency_matrix()
+    assert sparse_ids == node_ids
+    rows = np.repeat(np.arange(len(node_ids)), np.diff(indptr))
+    assert np.array_equal(m[rows, indices], data)
+    assert len(data) == np.count_nonzero(m) == 2 * graph.get_edge_count()
+    forward = sorted(zip(rows.tolist(), indices.tolist(), data.tolist()))
+    backward = sorted(zip(indices.tolist(), rows.tolist(), data.tolist()))
+    assert forward == backward
     
     print("[OK] Adjacency matrix test passed")
 
@@ -219,6 +270,14 @@ def test_graph_statistics():
     assert stats['edge_count'] == 5
     assert stats['density'] > 0
     assert stats['average_degree'] == 2.0  # Each node has 2 edges
+    assert stats['component_count'] == 1
+    
+    # Cached statistics must follow structural changes
+    graph.add_node(name="Isolated")
+    stats = graph.get_statistics()
+    assert stats['node_count'] == 6
+    assert stats['component_count'] == 2
+    assert stats['min_degree'] == 0
     
     print("[OK] Graph statistics test passed")
 
@@ -246,9 +305,164 @@ def test_edge_weight_calculation():
     
     assert edge_similar.weight > edge_different.weight
     
+    # Batch calculation agrees with the per-edge formula
+    nodes = [n1, n2, n3]
+    batch = calculate_weights_batch(
+        [n.activity for n in nodes],
+        [n.interaction for n in nodes],
+        [n.connection_count for n in nodes],
+        [0, 0], [1, 2]
+    )
+    assert abs(batch[0] - edge_similar.calculate_weight()) < 1e-12
+    assert abs(batch[1] - edge_different.calculate_weight()) < 1e-12
+    
     print("[OK] Edge weight calculation test passed")
 
 
+def test_add_nodes_bulk():
+    """Test adding nodes from column arrays."""
+    print("\n" + "=" * 50)
+    print("TEST: Bulk Node Insertion")
+    print("=" * 50)
+    
+    graph = Graph()
+    ids = np.arange(1, 6)
+    activities = np.linspace(0.2, 1.0, 5)
+    interactions = ids * 4
+    version = graph.version
+    
+    nodes = graph.add_nodes_bulk(ids, [f"N{i}" for i in ids], activities, interactions)
+    
+    assert [node.id for node in nodes] == [1, 2, 3, 4, 5]
+    assert graph.get_node_count() == 5
+    assert graph.version == version + 1
+    assert isinstance(nodes[0].activity, float)
+    
+    # Duplicate IDs are rejected before anything is added
+    try:
+        graph.add_nodes_bulk([6, 1], ["X", "Y"], [0.5, 0.5], [1, 1])
+        assert False, "Duplicate ID accepted"
+    except ValueError:
+        pass
+    assert graph.get_node_count() == 5
+    
+    # The columns give every edge weight in one vectorized call
+    for source, target in [(1, 2), (2, 3), (3, 4), (1, 5)]:
+        graph.add_edge(source, target)
+    counts = [graph.nodes[node_id].connection_count for node_id in ids.tolist()]
+    pairs_i = [edge.source.id - 1 for edge in graph.edges]
+    pairs_j = [edge.target.id - 1 for edge in graph.edges]
+    weights = calculate_weights_batch(activities, interactions, counts, pairs_i, pairs_j)
+    
+    expected = [edge.calculate_weight() for edge in graph.edges]
+    assert np.allclose(weights, expected, rtol=0, atol=1e-12)
+    print(f"Weights: {[f'{w:.4f}' for w in weights]}")
+    
+    print("[OK] Bulk node insertion test passed")
+
+
+def test_add_edges_from():
+    """Test adding many edges in one call."""
+    print("\n" + "=" * 50)
+    print("TEST: Bulk Edge Insertion")
+    print("=" * 50)
+    
+    pairs = [(1, 2), (2, 3), (3, 1), (2, 1), (1, 1), (3, 99), (4, 1)]
+    
+    def build():
+        graph = Graph()
+        for i in range(4):
+            graph.add_node(name=f"User{i+1}", activity=0.2 * (i + 1), interaction=3 * i)
+        return graph
+    
+    expected = build()
+    for source, target in pairs:
+        expected.add_edge(source, target)
+    
+    graph = build()
+    version = graph.version
+    added = graph.add_edges_from(np.array(pairs))
+    
+    # Same edges, order and weights as adding them one by one
+    assert len(added) == 4
+    assert graph.version == version + 1
+    assert graph.get_adjacency_list() == expected.get_adjacency_list()
+    assert [e.weight for e in graph.edges] == [e.weight for e in expected.edges]
+    assert graph.has_edge(1, 4) and graph.get_edge(4, 1) is added[-1]
+    
+    print(f"Added {len(added)} of {len(pairs)} pairs")
+    print("[OK] Bulk edge insertion test passed")
+
+
+def test_import_csv_short_rows():
+    """Test CSV import of rows that leave off trailing optional columns."""
+    print("\n" + "=" * 50)
+    print("TEST: CSV Import (Short Rows)")
+    print("=" * 50)
+    
+    content = (
+        "DugumId,Isim,Ozellik_I (Aktiflik),Ozellik_II (Etkilesim),"
+        "Ozellik_III (Bagl. Sayisi),X,Y,Komsular\n"
+        "1,A,0.5,10,1,100,100,2\n"
+        "2,B,0.6,11,1,200,200,1\n"
+        "3,C,0.4,12,0,300,300\n"
+        "4,D\n"
+    )
+    fd, filename = tempfile.mkstemp(suffix=".csv")
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(content)
+        graph = import_csv(filename)
+    finally:
+        os.remove(filename)
+    
+    assert graph.get_node_count() == 4
+    assert graph.get_edge_count() == 1
+    assert graph.get_degree(3) == 0
+    
+    # Missing optional columns fall back to the defaults
+    short = graph.nodes[4]
+    assert short.name == "D"
+    assert short.activity == 0.5 and short.interaction == 10.0
+    
+    print(f"Imported: {graph}")
+    print("[OK] CSV short row import test passed")
+
+
+def test_node_observers():
+    """Test that node observers see additions, removals and resets."""
+    print("\n" + "=" * 50)
+    print("TEST: Node Observers")
+    print("=" * 50)
+    
+    class Recorder:
+        def __init__(self):
+            self.events = []
+        
+        def on_nodes(self, event, payload):
+            self.events.append((event, payload))
+    
+    graph = Graph()
+    recorder = Recorder()
+    graph.add_node_observer(recorder.on_nodes)
+    
+    node = graph.add_node(name="A")
+    bulk = graph.add_nodes_bulk([10, 11], ["B", "C"], [0.5, 0.5], [1, 1])
+    graph.remove_node(node.id)
+    graph.clear()
+    assert recorder.events == [
+        ('added', [node]), ('added', bulk), ('removed', node.id), ('reset', None)
+    ]
+    
+    # Observers are not pickled and are held weakly
+    assert pickle.loads(pickle.dumps(graph))._node_observers == []
+    del recorder
+    graph.add_node(name="D")
+    assert graph._node_observers == []
+    
+    print("[OK] Node observer test passed")
+
+
 def main():
     """Run all tests."""
     print("=" * 60)
@@ -265,6 +479,10 @@ def main():
     test_adjacency_matrix()
     test_graph_statistics()
     test_edge_weight_calculation()
+    test_add_nodes_bulk()
+    test_add_edges_from()
+    test_import_csv_short_rows()
+    test_node_observers()
     
     print("\n" + "=" * 60)
     print("TÜM TESTLER BAŞARILI")